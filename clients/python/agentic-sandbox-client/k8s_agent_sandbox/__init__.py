@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .sandbox_client import SandboxClient
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     SandboxError,
     SandboxNotFoundError,
@@ -24,14 +25,55 @@ from .exceptions import (
     SandboxRequestError,
 )
 
+# The clients pull in kubernetes, requests and (for async) httpx and
+# kubernetes_asyncio, which dominate import time. Resolve them on first
+# attribute access so importing e.g. ``k8s_agent_sandbox.models`` stays cheap.
+_LAZY_CLIENTS = {
+    "SandboxClient": ".sandbox_client",
+    "AsyncSandboxClient": ".async_sandbox_client",
+}
 
-try:
+if TYPE_CHECKING:
     from .async_sandbox_client import AsyncSandboxClient
-except ImportError:
-    class AsyncSandboxClient:  # type: ignore[no-redef]
-        """Placeholder that raises ImportError when async extras are missing."""
-        def __init__(self, *args, **kwargs):
-            raise ImportError(
-                "AsyncSandboxClient requires the 'async' extras. "
-                "Install with: pip install k8s-agent-sandbox[async]"
-            )
+    from .sandbox_client import SandboxClient
+
+__all__ = [
+    "SandboxClient",
+    "AsyncSandboxClient",
+    "SandboxError",
+    "SandboxNotFoundError",
+    "SandboxTemplateNotFoundError",
+    "SandboxWarmPoolNotFoundError",
+    "SandboxNotReadyError",
+    "SandboxClaimFailedError",
+    "SandboxPortForwardError",
+    "SandboxRequestError",
+]
+
+
+class _MissingAsyncSandboxClient:
+    """Placeholder that raises ImportError when async extras are missing."""
+    def __init__(self, *args, **kwargs):
+        raise ImportError(
+            "AsyncSandboxClient requires the 'async' extras. "
+            "Install with: pip install k8s-agent-sandbox[async]"
+        )
+
+
+def __getattr__(name):
+    module_name = _LAZY_CLIENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if name != "AsyncSandboxClient":
+            raise
+        value = _MissingAsyncSandboxClient
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_CLIENTS))
@@ -15,6 +15,8 @@
 import asyncio
 import logging
 import math
+import random
+from types import MappingProxyType
 from typing import Callable, Awaitable
 
 import httpx
@@ -31,9 +33,75 @@ from .models import (
     SandboxLocalTunnelConnectionConfig,
 )
 
-RETRYABLE_STATUS_CODES = {500, 502, 503, 504}
-MAX_RETRIES = 5
-BACKOFF_FACTOR = 0.5
+# Negotiate HTTP/2 (via ALPN on TLS gateways) when the optional ``http2`` extra
+# is installed, so concurrent calls on one sandbox share a single connection.
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+RETRYABLE_STATUS_CODES = frozenset((502, 503, 504))
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+BACKOFF_MAX = 2.0
+
+
+# Keep-alive pool for the default transport. Connections are reused across
+# requests (and, via SharedTransport, across sandboxes) instead of paying a
+# TCP/TLS handshake per burst of calls.
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0
+)
+
+
+def _default_transport() -> httpx.AsyncHTTPTransport:
+    return httpx.AsyncHTTPTransport(
+        retries=3, http2=_HTTP2_AVAILABLE, limits=DEFAULT_POOL_LIMITS
+    )
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """Lends one connection pool to several connectors.
+
+    Closing a connector's ``httpx.AsyncClient`` closes its transport, so the
+    connectors receive this wrapper, whose ``aclose`` is a no-op; the owner
+    releases the pooled connections with ``close``.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        self._transport = transport or _default_transport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        await self._transport.aclose()
+
+
+def _retry_delay(response: httpx.Response, previous_delay: float) -> float:
+    """Returns the delay before the next attempt, honoring a numeric Retry-After on 503.
+
+    Retry-After is capped at BACKOFF_MAX like the computed backoff.
+
+    Otherwise uses decorrelated jitter (each delay drawn between the base and
+    three times the previous one, capped) so that clients retrying the same
+    overloaded gateway spread out instead of retrying in lockstep.
+    """
+    if response.status_code == 503:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                seconds = math.nan
+            # "inf" and "nan" parse as floats but would stall the coroutine.
+            if math.isfinite(seconds):
+                return min(BACKOFF_MAX, max(0.0, seconds))
+    return random.uniform(BACKOFF_FACTOR, min(BACKOFF_MAX, previous_delay * 3))
 
 
 def _router_timeout_header_value(timeout) -> str | None:
@@ -68,6 +136,7 @@ class AsyncSandboxConnector:
         connection_config: SandboxConnectionConfig,
         k8s_helper: AsyncK8sHelper,
         get_pod_ip: Callable[[], Awaitable[str | None]] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         if isinstance(connection_config, SandboxLocalTunnelConnectionConfig):
             raise ValueError(
@@ -88,6 +157,16 @@ class AsyncSandboxConnector:
         self._pod_ip_resolved = False
         self._pod_ip_auth_failed = False
         self._cached_pod_ip_url: str | None = None
+        self._url_base: str | None = None
+        # The identity headers are fixed for the connector's lifetime; only the
+        # timeout and pod IP headers vary per request. Read-only so no request
+        # path can alter what later requests send.
+        self._router_headers = MappingProxyType({
+            "X-Sandbox-ID": sandbox_id,
+            "X-Sandbox-Namespace": namespace,
+            "X-Sandbox-Port": str(connection_config.server_port),
+        })
+        self._url_prefix = ""
         if isinstance(connection_config, SandboxInClusterConnectionConfig):
             self._dns_url = (
                 f"http://{sandbox_id}.{namespace}"
@@ -102,7 +181,9 @@ class AsyncSandboxConnector:
             connection_config, SandboxInClusterConnectionConfig
         )
 
-        transport = httpx.AsyncHTTPTransport(retries=3)
+        # A caller-supplied transport replaces the default one, e.g. a
+        # SharedTransport lent by the client or one with different limits.
+        transport = transport or _default_transport()
         self.client = httpx.AsyncClient(
             transport=transport, timeout=httpx.Timeout(60.0)
         )
@@ -141,6 +222,16 @@ class AsyncSandboxConnector:
 
         return self._base_url
 
+    def _build_url(self, base_url: str, endpoint: str) -> str:
+        # The base URL only changes when the connection is re-established, so
+        # its stripped form is cached rather than rebuilt on every request.
+        if base_url != self._url_base:
+            self._url_base = base_url
+            self._url_prefix = base_url.rstrip("/") + "/"
+        if endpoint.startswith("/"):
+            endpoint = endpoint.lstrip("/")
+        return self._url_prefix + endpoint
+
     async def send_request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
         """Sends an HTTP request asynchronously to the sandbox with standard parameters.
 
@@ -153,7 +244,9 @@ class AsyncSandboxConnector:
             endpoint: The API endpoint path.
             **kwargs: Extra keyword arguments passed directly to the underlying
                 `httpx.AsyncClient.request` invocation. Note that 'follow_redirects'
-                is explicitly popped and overridden.
+                is explicitly popped and overridden. Pass ``stream=True`` to get
+                a successful response back with its body unread; the caller
+                must then consume it (e.g. ``aiter_bytes()``) and ``aclose()`` it.
 
         Returns:
             The `httpx.Response` object representing the response from the sandbox.
@@ -173,19 +266,18 @@ class AsyncSandboxConnector:
             and raise_for_status only raises for status codes 400 and above.
         """
         base_url = await self._resolve_base_url()
-        url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        url = self._build_url(base_url, endpoint)
 
-        headers = kwargs.pop("headers", {}).copy()
+        headers = dict(kwargs.pop("headers", None) or {})
         # For security and SSRF mitigation, the SDK explicitly mandates blocking all HTTP redirects
         # to the internal sandbox endpoints. Any user-provided redirect settings are overridden and
         # ignored. We pop 'follow_redirects' here to prevent a TypeError due to duplicate keyword
         # arguments when calling httpx.AsyncClient.request.
         kwargs.pop("follow_redirects", None)
+        stream = kwargs.pop("stream", False)
 
         if self._inject_router_headers:
-            headers["X-Sandbox-ID"] = self.id
-            headers["X-Sandbox-Namespace"] = self.namespace
-            headers["X-Sandbox-Port"] = str(self.connection_config.server_port)
+            headers.update(self._router_headers)
             timeout_header = _router_timeout_header_value(kwargs.get("timeout"))
             if timeout_header is not None:
                 headers["X-Sandbox-Timeout"] = timeout_header
@@ -207,13 +299,22 @@ class AsyncSandboxConnector:
                     headers["X-Sandbox-Pod-IP"] = self._pod_ip
 
         last_response: httpx.Response | None = None
+        delay = BACKOFF_FACTOR
         for attempt in range(MAX_RETRIES + 1):
             try:
-                response = await self.client.request(
-                    method, url, headers=headers, follow_redirects=False, **kwargs
-                )
+                if stream:
+                    request = self.client.build_request(method, url, headers=headers, **kwargs)
+                    response = await self.client.send(request, stream=True, follow_redirects=False)
+                    if not 200 <= response.status_code < 300:
+                        # Error bodies are small: load them so a retry releases
+                        # the connection and callers can still read the body.
+                        await response.aread()
+                else:
+                    response = await self.client.request(
+                        method, url, headers=headers, follow_redirects=False, **kwargs
+                    )
                 if response.status_code in RETRYABLE_STATUS_CODES and attempt < MAX_RETRIES:
-                    delay = BACKOFF_FACTOR * (2 ** attempt)
+                    delay = _retry_delay(response, delay)
                     logger.warning(
                         f"Retryable status {response.status_code} from {url}, "
                         f"attempt {attempt + 1}/{MAX_RETRIES + 1}, retrying in {delay:.1f}s"
@@ -227,7 +328,10 @@ class AsyncSandboxConnector:
                         request=response.request,
                         response=response,
                     )
-                response.raise_for_status()
+                # httpx treats any non-2xx status as an error; skip the call on
+                # the success path.
+                if not 200 <= response.status_code < 300:
+                    response.raise_for_status()
                 return response
             except httpx.HTTPStatusError as e:
                 logger.error(f"Request to sandbox failed: {e}")
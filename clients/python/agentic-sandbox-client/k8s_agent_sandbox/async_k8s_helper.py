@@ -15,7 +15,6 @@
 import asyncio
 import logging
 import time
-from datetime import datetime, UTC
 
 from kubernetes_asyncio import client, config, watch
 
@@ -25,18 +24,36 @@ from .constants import (
     CLAIM_API_GROUP,
     CLAIM_API_VERSION,
     CLAIM_PLURAL_NAME,
-    CLIENT_REQUEST_TIME_ANNOTATION,
     GATEWAY_API_GROUP,
     GATEWAY_API_VERSION,
     GATEWAY_PLURAL,
     SANDBOX_API_GROUP,
     SANDBOX_API_VERSION,
     SANDBOX_PLURAL_NAME,
-    CREATED_BY_LABEL,
     TERMINAL_CLAIM_READY_REASONS,
 )
 from .exceptions import SandboxClaimFailedError, SandboxMetadataError, SandboxNotFoundError, SandboxTemplateNotFoundError, SandboxWarmPoolNotFoundError
-from .utils import select_pod_ip, is_valid_ip, is_valid_gateway_hostname
+from .utils import build_sandbox_claim_manifest, select_pod_ip, is_valid_ip, is_valid_gateway_hostname
+
+
+_kube_config_loaded = False
+
+
+async def _ensure_kube_config_loaded():
+    """Loads the in-cluster or kubeconfig configuration once per process.
+
+    The loaded settings become kubernetes_asyncio's default configuration,
+    which every later ``ApiClient()`` copies, so helpers created afterwards
+    skip re-reading and re-parsing the kubeconfig.
+    """
+    global _kube_config_loaded
+    if _kube_config_loaded:
+        return
+    try:
+        config.load_incluster_config()
+    except config.ConfigException:
+        await config.load_kube_config()
+    _kube_config_loaded = True
 
 
 class AsyncK8sHelper:
@@ -53,10 +70,7 @@ class AsyncK8sHelper:
         async with self._init_lock:
             if self._initialized:
                 return
-            try:
-                config.load_incluster_config()
-            except config.ConfigException:
-                await config.load_kube_config()
+            await _ensure_kube_config_loaded()
             self._api_client = client.ApiClient()
             self.custom_objects_api = client.CustomObjectsApi(self._api_client)
             self.core_v1_api = client.CoreV1Api(self._api_client)
@@ -83,37 +97,15 @@ class AsyncK8sHelper:
         """
         await self._ensure_initialized()
 
-        updated_annotations = dict(annotations) if annotations else {}
-        if CLIENT_REQUEST_TIME_ANNOTATION not in updated_annotations:
-            updated_annotations[CLIENT_REQUEST_TIME_ANNOTATION] = datetime.now(UTC).isoformat()
-
-        metadata = {
-            "name": name,
-            "annotations": updated_annotations,
-            "labels": {
-                **(labels or {}),
-                CREATED_BY_LABEL: "python-client",
-            }
-        }
-
-        spec = {
-            "warmPoolRef": {
-                "name": warmpool,
-            }
-        }
-        if lifecycle:
-            spec["lifecycle"] = lifecycle
-        if volume_claim_templates:
-            spec["volumeClaimTemplates"] = volume_claim_templates
-        if pod_metadata:
-            spec["additionalPodMetadata"] = pod_metadata
-
-        manifest = {
-            "apiVersion": f"{CLAIM_API_GROUP}/{CLAIM_API_VERSION}",
-            "kind": "SandboxClaim",
-            "metadata": metadata,
-            "spec": spec,
-        }
+        manifest = build_sandbox_claim_manifest(
+            name,
+            warmpool,
+            annotations=annotations,
+            labels=labels,
+            lifecycle=lifecycle,
+            volume_claim_templates=volume_claim_templates,
+            pod_metadata=pod_metadata,
+        )
         logger.info(
             f"Creating SandboxClaim '{name}' in namespace '{namespace}' using warm pool '{warmpool}'..."
         )
@@ -221,30 +213,26 @@ class AsyncK8sHelper:
 
                         ready = False
                         for cond in status.get("conditions", []):
-                            if (
-                                cond.get("type") == "Ready"
-                                and cond.get("status") == "False"
-                                and cond.get("reason") == "TemplateNotFound"
-                            ):
+                            cond_type = cond.get("type")
+                            cond_status = cond.get("status")
+                            reason = cond.get("reason")
+                            not_ready = cond_type == "Ready" and cond_status == "False"
+                            if not_ready and reason == "TemplateNotFound":
                                 raise SandboxTemplateNotFoundError(
                                     f"SandboxTemplate requested does not exist: {cond.get('message', 'Template not found')}"
                                 )
-                            elif cond.get("reason") == "WarmPoolNotFound":
+                            elif reason == "WarmPoolNotFound":
                                 raise SandboxWarmPoolNotFoundError(
                                     f"SandboxWarmPool requested does not exist: {cond.get('message', 'WarmPool not found')}"
                                 )
-                            elif (
-                                cond.get("type") == "Ready"
-                                and cond.get("status") == "False"
-                                and cond.get("reason") in TERMINAL_CLAIM_READY_REASONS
-                            ):
+                            elif not_ready and reason in TERMINAL_CLAIM_READY_REASONS:
                                 # The controller reported a failure it will not
                                 # retry; waiting out the timeout cannot succeed.
                                 raise SandboxClaimFailedError(
                                     f"SandboxClaim '{claim_name}' failed with terminal reason "
-                                    f"{cond.get('reason')}: {cond.get('message', '')}"
+                                    f"{reason}: {cond.get('message', '')}"
                                 )
-                            if cond.get("type") == "Ready" and cond.get("status") == "True":
+                            if cond_type == "Ready" and cond_status == "True":
                                 ready = True
 
                         sandbox_status = status.get("sandbox", {})
@@ -279,6 +267,7 @@ class AsyncK8sHelper:
         await self._ensure_initialized()
 
         deadline = time.monotonic() + timeout
+        rv = None
         logger.info(f"Watching for Sandbox {name} to become ready...")
         while True:
             remaining = int(deadline - time.monotonic())
@@ -293,24 +282,38 @@ class AsyncK8sHelper:
                     version=SANDBOX_API_VERSION,
                     plural=SANDBOX_PLURAL_NAME,
                     field_selector=f"metadata.name={name}",
+                    resource_version=rv,
                     timeout_seconds=remaining,
                 ):
                     if event is None:
                         continue
                     if event["type"] in ["ADDED", "MODIFIED"]:
                         sandbox_object = event["object"]
+                        # Resume a restarted stream from the last-seen version.
+                        rv = (sandbox_object.get("metadata") or {}).get("resourceVersion") or rv
                         status = sandbox_object.get("status") or {}
-                        conditions = status.get("conditions", [])
-                        for cond in conditions:
-                            if cond.get("type") == "Ready" and cond.get("status") == "True":
-                                logger.info(f"Sandbox {name} is ready.")
-                                pod_ips = status.get("podIPs", [])
-                                return select_pod_ip(pod_ips)
+                        ready_cond = next(
+                            (c for c in status.get("conditions", ()) if c.get("type") == "Ready"),
+                            None,
+                        )
+                        if ready_cond and ready_cond.get("status") == "True":
+                            logger.info(f"Sandbox {name} is ready.")
+                            pod_ips = status.get("podIPs", [])
+                            return select_pod_ip(pod_ips)
                     elif event["type"] == "DELETED":
                         logger.error(f"Sandbox {name} was deleted before becoming ready.")
                         raise SandboxNotFoundError(
                             f"Sandbox {name} was deleted before becoming ready."
                         )
+            except client.ApiException as e:
+                if e.status == 410:
+                    logger.info(
+                        f"Watch on Sandbox '{name}' expired (410 Gone at resourceVersion={rv}); "
+                        "restarting from current state"
+                    )
+                    rv = None
+                    continue
+                raise
             finally:
                 await w.close()
 
@@ -388,9 +391,9 @@ class AsyncK8sHelper:
                 kwargs["label_selector"] = label_selector
             response = await self.custom_objects_api.list_namespaced_custom_object(**kwargs)
             return [
-                item.get("metadata", {}).get("name")
+                name
                 for item in response.get("items", [])
-                if item.get("metadata", {}).get("name")
+                if (name := (item.get("metadata") or {}).get("name"))
             ]
         except client.ApiException as e:
             logger.error(f"Error listing sandbox claims in namespace {namespace}: {e}")
@@ -401,6 +404,7 @@ class AsyncK8sHelper:
         await self._ensure_initialized()
 
         deadline = time.monotonic() + timeout
+        rv = None
         logger.info(f"Waiting for Gateway '{gateway_name}' in namespace '{namespace}'...")
         while True:
             remaining = int(deadline - time.monotonic())
@@ -415,12 +419,14 @@ class AsyncK8sHelper:
                     version=GATEWAY_API_VERSION,
                     plural=GATEWAY_PLURAL,
                     field_selector=f"metadata.name={gateway_name}",
+                    resource_version=rv,
                     timeout_seconds=remaining,
                 ):
                     if event is None:
                         continue
                     if event["type"] in ["ADDED", "MODIFIED"]:
                         gateway_object = event["object"]
+                        rv = (gateway_object.get("metadata") or {}).get("resourceVersion") or rv
                         status = gateway_object.get("status") or {}
                         addresses = status.get("addresses", [])
                         for address in addresses:
@@ -439,6 +445,15 @@ class AsyncK8sHelper:
                                 
                             logger.info(f"Gateway ready. IP: {ip_address}")
                             return ip_address
+            except client.ApiException as e:
+                if e.status == 410:
+                    logger.info(
+                        f"Watch on Gateway '{gateway_name}' expired (410 Gone at resourceVersion={rv}); "
+                        "restarting from current state"
+                    )
+                    rv = None
+                    continue
+                raise
             finally:
                 await w.close()
 
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 
+import httpx
+
 from .async_connector import AsyncSandboxConnector
 from .async_k8s_helper import AsyncK8sHelper
 from .commands.async_command_executor import AsyncCommandExecutor
@@ -46,6 +49,7 @@ class AsyncSandbox:
         connection_config: SandboxConnectionConfig | None = None,
         tracer_config: SandboxTracerConfig | None = None,
         k8s_helper: AsyncK8sHelper | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         if connection_config is None:
             raise ValueError(
@@ -67,6 +71,7 @@ class AsyncSandbox:
             connection_config=self.connection_config,
             k8s_helper=self.k8s_helper,
             get_pod_ip=self.get_pod_ip,
+            transport=transport,
         )
 
         self.tracer_config = tracer_config or SandboxTracerConfig()
@@ -198,11 +203,20 @@ class AsyncSandbox:
         already been removed, subsequent calls will handle the API 404 gracefully
         rather than raising an error.
         """
-        await self.close_connection()
-
         if not self.claim_name:
+            await self.close_connection()
             return
 
-        await self.k8s_helper.delete_sandbox_claim(self.claim_name, self.namespace)
-
+        # Closing the local connection and deleting the claim are independent,
+        # so run them concurrently. Both are always awaited to completion; a
+        # delete failure takes precedence so the claim name is kept for retry.
+        close_result, delete_result = await asyncio.gather(
+            self.close_connection(),
+            self.k8s_helper.delete_sandbox_claim(self.claim_name, self.namespace),
+            return_exceptions=True,
+        )
+        if isinstance(delete_result, BaseException):
+            raise delete_result
         self.claim_name = None
+        if isinstance(close_result, BaseException):
+            raise close_result
@@ -23,14 +23,16 @@ import atexit
 import asyncio
 import logging
 import sys
-import uuid
 from typing import Generic, TypeVar
 
+import httpx
+
+from .async_connector import SharedTransport
 from .async_k8s_helper import AsyncK8sHelper
 from .async_sandbox import AsyncSandbox
 from .exceptions import SandboxNotFoundError
 from .pod_metadata import build_pod_metadata, validate_labels
-from .utils import construct_sandbox_claim_lifecycle_spec
+from .utils import construct_sandbox_claim_lifecycle_spec, generate_claim_name
 from .models import SandboxConnectionConfig, SandboxInClusterConnectionConfig, SandboxTracerConfig
 from .trace_manager import async_trace_span, create_tracer_manager, initialize_tracer, trace
 
@@ -75,6 +77,7 @@ class AsyncSandboxClient(Generic[T]):
         connection_config: SandboxConnectionConfig | None = None,
         tracer_config: SandboxTracerConfig | None = None,
         cleanup: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """
         Args:
@@ -93,6 +96,10 @@ class AsyncSandboxClient(Generic[T]):
                 sandboxes are not leaked when a caller forgets to clean up;
                 pass ``cleanup=False`` to opt out. Note this differs from the
                 synchronous ``SandboxClient``, which defaults to False.
+            transport: Optional ``httpx`` transport shared by every sandbox
+                this client opens, e.g. to tune pool limits or plug in a
+                multiplexing transport. The caller owns it: ``close()`` leaves
+                it open. Defaults to a pooled transport owned by the client.
         """
         if connection_config is None:
             raise ValueError(
@@ -110,6 +117,9 @@ class AsyncSandboxClient(Generic[T]):
         self.tracing_manager, self.tracer = create_tracer_manager(self.tracer_config)
 
         self.k8s_helper = AsyncK8sHelper()
+        # One connection pool for every sandbox this client opens.
+        self._owns_transport = transport is None
+        self._transport = SharedTransport(transport)
 
         self._active_connection_sandboxes: dict[tuple[str, str], T] = {}
         self._lock = asyncio.Lock()
@@ -135,6 +145,9 @@ class AsyncSandboxClient(Generic[T]):
                 except Exception as e:
                     logger.error(f"Failed to close sandbox connection: {e}")
             self._active_connection_sandboxes.clear()
+            if self._owns_transport:
+                await self._transport.close()
+                self._transport = SharedTransport()
         await self.k8s_helper.close()
 
     async def create_sandbox(
@@ -187,7 +200,7 @@ class AsyncSandboxClient(Generic[T]):
 
         lifecycle = construct_sandbox_claim_lifecycle_spec(shutdown_after_seconds) if shutdown_after_seconds is not None else None
 
-        claim_name = f"sandbox-claim-{uuid.uuid4().hex[:8]}"
+        claim_name = generate_claim_name()
 
         try:
             created_claim = await self._create_claim(
@@ -220,6 +233,7 @@ class AsyncSandboxClient(Generic[T]):
                 connection_config=self.connection_config,
                 tracer_config=self.tracer_config,
                 k8s_helper=self.k8s_helper,
+                transport=self._transport,
             )
         except (Exception, asyncio.CancelledError):
             await asyncio.shield(self._delete_claim(claim_name, namespace))
@@ -316,6 +330,7 @@ class AsyncSandboxClient(Generic[T]):
             connection_config=self.connection_config,
             tracer_config=self.tracer_config,
             k8s_helper=self.k8s_helper,
+            transport=self._transport,
         )
 
         async with self._lock:
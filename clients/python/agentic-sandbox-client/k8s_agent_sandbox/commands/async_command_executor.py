@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import List
+
 from k8s_agent_sandbox.async_connector import AsyncSandboxConnector
+from k8s_agent_sandbox.constants import BATCH_UNSUPPORTED_STATUS_CODES
+from k8s_agent_sandbox.exceptions import SandboxRequestError
 from k8s_agent_sandbox.models import ExecutionResult
+from k8s_agent_sandbox.utils import decode_json
 from k8s_agent_sandbox.trace_manager import async_trace_span, trace
 
 
@@ -38,11 +43,14 @@ class AsyncCommandExecutor:
         self.connector = connector
         self.tracer = tracer
         self.trace_service_name = trace_service_name
+        # Cleared once the runtime turns out not to serve /execute_batch.
+        self._batch_supported = True
 
     @async_trace_span("run")
     async def run(self, command: str, timeout: int = 60) -> ExecutionResult:
         span = trace.get_current_span()
-        if span.is_recording():
+        recording = span.is_recording()
+        if recording:
             executable = _extract_executable(command)
             span.set_attribute("sandbox.command.executable", executable)
 
@@ -52,7 +60,7 @@ class AsyncCommandExecutor:
         )
 
         try:
-            response_data = response.json()
+            response_data = decode_json(response.content)
         except ValueError as e:
             raise RuntimeError(
                 f"Failed to decode JSON response from sandbox: {response.text}"
@@ -64,6 +72,54 @@ class AsyncCommandExecutor:
                 f"Server returned invalid execution result format: {response_data}"
             ) from e
 
-        if span.is_recording():
+        if recording:
             span.set_attribute("sandbox.exit_code", result.exit_code)
         return result
+
+    @async_trace_span("run_many")
+    async def run_many(
+        self, commands: List[str], timeout: int = 60, stop_on_error: bool = True
+    ) -> List[ExecutionResult]:
+        """Runs several commands sequentially; see ``CommandExecutor.run_many``."""
+        span = trace.get_current_span()
+        recording = span.is_recording()
+        if recording:
+            span.set_attribute("sandbox.command.count", len(commands))
+
+        if not self._batch_supported:
+            return await self._run_each(commands, timeout, stop_on_error)
+
+        payload = {"commands": list(commands), "stop_on_error": stop_on_error}
+        try:
+            response = await self.connector.send_request(
+                "POST", "execute_batch", json=payload, timeout=timeout
+            )
+        except SandboxRequestError as e:
+            if e.status_code not in BATCH_UNSUPPORTED_STATUS_CODES:
+                raise
+            self._batch_supported = False
+            return await self._run_each(commands, timeout, stop_on_error)
+
+        try:
+            response_data = decode_json(response.content)
+        except ValueError as e:
+            raise RuntimeError(
+                f"Failed to decode JSON response from sandbox: {response.text}"
+            ) from e
+        try:
+            return [ExecutionResult(**item) for item in response_data]
+        except Exception as e:
+            raise RuntimeError(
+                f"Server returned invalid execution result format: {response_data}"
+            ) from e
+
+    async def _run_each(
+        self, commands: List[str], timeout: int, stop_on_error: bool
+    ) -> List[ExecutionResult]:
+        results = []
+        for command in commands:
+            result = await self.run(command, timeout=timeout)
+            results.append(result)
+            if stop_on_error and result.exit_code != 0:
+                break
+        return results
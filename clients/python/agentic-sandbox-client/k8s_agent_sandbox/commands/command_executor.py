@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 from k8s_agent_sandbox.connector import SandboxConnector
+from k8s_agent_sandbox.constants import BATCH_UNSUPPORTED_STATUS_CODES
+from k8s_agent_sandbox.exceptions import SandboxRequestError
 from k8s_agent_sandbox.models import ExecutionResult
+from k8s_agent_sandbox.utils import decode_json
 from k8s_agent_sandbox.trace_manager import trace_span, trace
 
 def _extract_executable(command: str) -> str:
@@ -37,11 +40,14 @@ class CommandExecutor:
         self.connector = connector
         self.tracer = tracer
         self.trace_service_name = trace_service_name
+        # Cleared once the runtime turns out not to serve /execute_batch.
+        self._batch_supported = True
 
     @trace_span("run")
     def run(self, command: str, timeout: int = 60) -> ExecutionResult:
         span = trace.get_current_span()
-        if span.is_recording():
+        recording = span.is_recording()
+        if recording:
             executable = _extract_executable(command)
             span.set_attribute("sandbox.command.executable", executable)
 
@@ -50,7 +56,7 @@ class CommandExecutor:
             "POST", "execute", json=payload, timeout=timeout)
 
         try:
-            response_data = response.json()
+            response_data = decode_json(response.content)
         except ValueError as e:
             raise RuntimeError(f"Failed to decode JSON response from sandbox: {response.text}") from e
         try:
@@ -58,6 +64,60 @@ class CommandExecutor:
         except Exception as e:
             raise RuntimeError(f"Server returned invalid execution result format: {response_data}") from e
 
-        if span.is_recording():
+        if recording:
             span.set_attribute("sandbox.exit_code", result.exit_code)
         return result
+
+    @trace_span("run_many")
+    def run_many(
+        self, commands: List[str], timeout: int = 60, stop_on_error: bool = True
+    ) -> List[ExecutionResult]:
+        """Runs several commands sequentially, in a single request when possible.
+
+        Batching needs a sandbox runtime that serves ``POST /execute_batch``
+        (such as ``examples/python-runtime-sandbox``). If the runtime answers
+        404 or 405, each command is sent through ``run`` instead, and later
+        calls skip the batch request.
+
+        ``timeout`` bounds the whole batch request rather than each command;
+        in the one-at-a-time fallback it applies to each command. When
+        ``stop_on_error`` is set, execution stops after the first non-zero
+        exit code, so fewer results than commands may be returned.
+        """
+        span = trace.get_current_span()
+        recording = span.is_recording()
+        if recording:
+            span.set_attribute("sandbox.command.count", len(commands))
+
+        if not self._batch_supported:
+            return self._run_each(commands, timeout, stop_on_error)
+
+        payload = {"commands": list(commands), "stop_on_error": stop_on_error}
+        try:
+            response = self.connector.send_request(
+                "POST", "execute_batch", json=payload, timeout=timeout)
+        except SandboxRequestError as e:
+            if e.status_code not in BATCH_UNSUPPORTED_STATUS_CODES:
+                raise
+            self._batch_supported = False
+            return self._run_each(commands, timeout, stop_on_error)
+
+        try:
+            response_data = decode_json(response.content)
+        except ValueError as e:
+            raise RuntimeError(f"Failed to decode JSON response from sandbox: {response.text}") from e
+        try:
+            return [ExecutionResult(**item) for item in response_data]
+        except Exception as e:
+            raise RuntimeError(f"Server returned invalid execution result format: {response_data}") from e
+
+    def _run_each(
+        self, commands: List[str], timeout: int, stop_on_error: bool
+    ) -> List[ExecutionResult]:
+        results = []
+        for command in commands:
+            result = self.run(command, timeout=timeout)
+            results.append(result)
+            if stop_on_error and result.exit_code != 0:
+                break
+        return results
@@ -14,9 +14,14 @@
 
 import logging
 import math
+import os
+import select
+import selectors
 import socket
 import subprocess
+import threading
 import time
+from types import MappingProxyType
 from typing import Callable
 import requests
 from abc import ABC, abstractmethod
@@ -38,6 +43,101 @@ from .exceptions import (
 
 ROUTER_SERVICE_NAME = "svc/sandbox-router-svc"
 
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_BACKOFF_MAX = 2.0
+HTTP_RETRY_STATUSES = (502, 503, 504)
+
+
+class _CappedRetry(Retry):
+    """Retry whose backoff and Retry-After waits never exceed HTTP_BACKOFF_MAX.
+
+    urllib3 1.26 has no ``backoff_max`` argument, so the cap is applied here
+    rather than passed to the constructor.
+    """
+
+    def get_backoff_time(self) -> float:
+        return min(HTTP_BACKOFF_MAX, super().get_backoff_time())
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        return min(HTTP_BACKOFF_MAX, super().parse_retry_after(retry_after))
+
+
+def build_retry(
+    total: int = HTTP_RETRIES,
+    backoff_factor: float = HTTP_BACKOFF_FACTOR,
+    status_forcelist=HTTP_RETRY_STATUSES,
+) -> Retry:
+    """Returns the urllib3 retry policy used for sandbox HTTP requests."""
+    return _CappedRetry(
+        total=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=frozenset(status_forcelist),
+        allowed_methods=frozenset(("GET", "POST", "PUT", "DELETE")),
+        respect_retry_after_header=True,
+        # Return the last 5xx once retries run out, so send_request reports
+        # its status instead of a status-less RetryError.
+        raise_on_status=False,
+    )
+
+
+# Transient gateway/router failures are retried inside urllib3's connection
+# pool, reusing the pooled connection instead of surfacing an error per attempt.
+# Retry is immutable (each attempt derives a new instance), so one policy is
+# safely shared by every connector.
+DEFAULT_RETRY = build_retry()
+
+_shared_adapter: HTTPAdapter | None = None
+_shared_adapter_lock = threading.Lock()
+
+
+def build_http_adapter(max_retries: Retry = DEFAULT_RETRY) -> HTTPAdapter:
+    """Returns a pooled adapter that retries with ``max_retries``."""
+    return HTTPAdapter(pool_connections=50, pool_maxsize=100, max_retries=max_retries)
+
+
+def _get_shared_adapter() -> HTTPAdapter:
+    """Returns the process-wide retrying adapter mounted by default.
+
+    Sharing one adapter means every connector draws from the same urllib3 pool
+    manager, so sandboxes reached through the same gateway or router reuse
+    keep-alive connections instead of each paying for a fresh handshake.
+    """
+    global _shared_adapter
+    if _shared_adapter is None:
+        with _shared_adapter_lock:
+            if _shared_adapter is None:
+                _shared_adapter = build_http_adapter()
+    return _shared_adapter
+
+
+def _wait_for_exit(process: subprocess.Popen, timeout: float) -> bool:
+    """Waits up to ``timeout`` seconds for ``process`` to exit and reaps it.
+
+    Popen.wait(timeout=...) sleeps in a polling loop; where pidfds are
+    available (Linux 5.3+) the exit is awaited as a single poll() on the
+    process fd instead. Returns False if the process is still running.
+    """
+    if process.poll() is not None:
+        return True
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            return False
+    finally:
+        os.close(pidfd)
+    process.wait()
+    return True
+
 
 def _router_timeout_header_value(timeout) -> str | None:
     value = None
@@ -155,6 +255,55 @@ class LocalTunnelConnectionStrategy(ConnectionStrategy):
         except (socket.timeout, ConnectionRefusedError):
             return False
 
+    def _raise_if_exited(self):
+        if self.port_forward_process.poll() is not None:
+            _, stderr = self.port_forward_process.communicate()
+            raise SandboxPortForwardError(
+                f"Tunnel crashed: {stderr.decode(errors='replace')}")
+
+    def _poll_port(self, port: int, deadline: float) -> bool:
+        """Probes the local port until it accepts connections or the deadline passes."""
+        while time.monotonic() < deadline:
+            self._raise_if_exited()
+            if self._is_port_open(port):
+                return True
+            # Poll the local port at 50ms: this is a cheap localhost socket
+            # probe, and a coarser interval (e.g. 500ms) adds a uniform
+            # 0-500ms of avoidable latency to the first sandbox request.
+            time.sleep(0.05)
+        return False
+
+    def _wait_for_forwarding(self, port: int, deadline: float) -> bool:
+        """Waits for kubectl to report that the tunnel is listening.
+
+        kubectl prints "Forwarding from 127.0.0.1:<port>" as soon as its
+        listener is up, so readiness is read from its stdout instead of
+        probing the port in a loop; one probe then confirms the listener.
+        Falls back to probing alone where the pipe cannot be selected on
+        (e.g. Windows) or stdout closes early. Returns False on timeout.
+        """
+        stdout = self.port_forward_process.stdout
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(stdout, selectors.EVENT_READ)
+        except (AttributeError, TypeError, ValueError, OSError):
+            selector.close()
+            return self._poll_port(port, deadline)
+
+        # On Windows register() accepts the pipe (it only needs fileno()), but
+        # select() then fails with WinError 10038 because it only takes sockets.
+        with selector:
+            try:
+                while (remaining := deadline - time.monotonic()) > 0:
+                    if not selector.select(timeout=remaining):
+                        break
+                    line = stdout.readline()
+                    if not line or b"Forwarding from" in line:
+                        break
+            except OSError:
+                pass
+        return self._poll_port(port, deadline)
+
     def connect(self) -> str:
         if self.base_url and self.port_forward_process and self.port_forward_process.poll() is None:
              return self.base_url
@@ -183,21 +332,11 @@ class LocalTunnelConnectionStrategy(ConnectionStrategy):
             )
 
             logging.info("Waiting for port-forwarding to be ready...")
-            while time.monotonic() - start_time < self.config.port_forward_ready_timeout:
-                if self.port_forward_process.poll() is not None:
-                    _, stderr = self.port_forward_process.communicate()
-                    raise SandboxPortForwardError(
-                        f"Tunnel crashed: {stderr.decode(errors='replace')}")
-
-                if self._is_port_open(local_port):
-                    self.base_url = f"http://127.0.0.1:{local_port}"
-                    logging.info(f"Tunnel ready at {self.base_url}")
-                    return self.base_url
-
-                # Poll the local port at 50ms: this is a cheap localhost socket
-                # probe, and a coarser interval (e.g. 500ms) adds a uniform
-                # 0-500ms of avoidable latency to the first sandbox request.
-                time.sleep(0.05)
+            deadline = start_time + self.config.port_forward_ready_timeout
+            if self._wait_for_forwarding(local_port, deadline):
+                self.base_url = f"http://127.0.0.1:{local_port}"
+                logging.info(f"Tunnel ready at {self.base_url}")
+                return self.base_url
 
             self.close()
             raise TimeoutError("Failed to establish tunnel to Router Service.")
@@ -213,9 +352,7 @@ class LocalTunnelConnectionStrategy(ConnectionStrategy):
             try:
                 logging.info(f"Stopping port-forwarding for Sandbox {self.sandbox_id}...")
                 self.port_forward_process.terminate()
-                try:
-                    self.port_forward_process.wait(timeout=2)
-                except subprocess.TimeoutExpired:
+                if not _wait_for_exit(self.port_forward_process, timeout=2):
                     self.port_forward_process.kill()
             except Exception as e:
                 logging.error(f"Failed to stop port-forwarding: {e}")
@@ -290,6 +427,7 @@ class SandboxConnector:
         connection_config: SandboxConnectionConfig,
         k8s_helper: K8sHelper,
         get_pod_ip: Callable[[], str | None] | None = None,
+        http_adapter: HTTPAdapter | None = None,
     ):
         # Parameter initialization
         self.id = sandbox_id
@@ -300,20 +438,29 @@ class SandboxConnector:
         self._pod_ip: str | None = None
         self._pod_ip_resolved = False
         self._pod_ip_auth_failed = False
+        self._url_base: str | None = None
+        self._url_prefix = ""
 
         # Connection strategy initialization
         self.strategy = self._connection_strategy()
+
+        # The identity headers are fixed for the connector's lifetime; only the
+        # timeout and pod IP headers vary per request. Read-only so no request
+        # path can alter what later requests send.
+        self._router_headers = MappingProxyType({
+            "X-Sandbox-ID": sandbox_id,
+            "X-Sandbox-Namespace": namespace,
+            "X-Sandbox-Port": str(connection_config.server_port),
+        })
         
         # HTTP Session setup
         self.session = requests.Session()
-        retries = Retry(
-            total=5,
-            backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"]
-        )
-        self.session.mount("http://", HTTPAdapter(max_retries=retries))
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        # A caller-supplied adapter replaces the shared retrying one, e.g. to
+        # tune pool sizes or plug in a different transport. Either way the
+        # adapter may back other connectors, so it is never closed here.
+        adapter = http_adapter or _get_shared_adapter()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
 
     def _connection_strategy(self):
@@ -328,6 +475,16 @@ class SandboxConnector:
         else:
             raise ValueError("Unknown connection configuration type")
 
+    def _build_url(self, base_url: str, endpoint: str) -> str:
+        # The base URL only changes when the connection is re-established, so
+        # its stripped form is cached rather than rebuilt on every request.
+        if base_url != self._url_base:
+            self._url_base = base_url
+            self._url_prefix = base_url.rstrip("/") + "/"
+        if endpoint.startswith("/"):
+            endpoint = endpoint.lstrip("/")
+        return self._url_prefix + endpoint
+
     def get_conn_strategy(self):
         return self.strategy
 
@@ -338,8 +495,8 @@ class SandboxConnector:
         self._pod_ip_resolved = False
         self._pod_ip = None
         self.strategy.close()
-        if self.session:
-            self.session.close()
+        # Closing the session would close its adapter, which other connectors
+        # may still be using; its owner (or the process) releases the pool.
 
     def send_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Sends an HTTP request to the sandbox with standard parameters.
@@ -382,13 +539,11 @@ class SandboxConnector:
             self.strategy.verify_connection()
 
             # Prepare the request
-            url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+            url = self._build_url(base_url, endpoint)
 
-            headers = kwargs.get("headers", {}).copy()
+            headers = dict(kwargs.get("headers") or {})
             if self.strategy.should_inject_router_headers():
-                headers["X-Sandbox-ID"] = self.id
-                headers["X-Sandbox-Namespace"] = self.namespace
-                headers["X-Sandbox-Port"] = str(self.connection_config.server_port)
+                headers.update(self._router_headers)
                 timeout_header = _router_timeout_header_value(kwargs.get("timeout"))
                 if timeout_header is not None:
                     headers["X-Sandbox-Timeout"] = timeout_header
@@ -423,7 +578,10 @@ class SandboxConnector:
                     f"Redirection is not allowed (status code {response.status_code}).",
                     response=response,
                 )
-            response.raise_for_status()
+            # Only build the HTTPError on failure; the success path is a
+            # plain int compare instead of a method call per request.
+            if response.status_code >= 400:
+                response.raise_for_status()
             return response
         except SandboxPortForwardError:
             self.close()
@@ -20,6 +20,7 @@ GATEWAY_PLURAL = "gateways"
 CLAIM_API_GROUP = "extensions.agents.x-k8s.io"
 CLAIM_API_VERSION = "v1beta1"
 CLAIM_PLURAL_NAME = "sandboxclaims"
+CLAIM_API_GROUP_VERSION = f"{CLAIM_API_GROUP}/{CLAIM_API_VERSION}"
 
 SANDBOX_API_GROUP = "agents.x-k8s.io"
 SANDBOX_API_VERSION = "v1beta1"
@@ -31,6 +32,7 @@ CREATED_BY_LABEL = "agents.x-k8s.io/created-by"
 PODSNAPSHOT_POD_NAME_ANNOTATION = "podsnapshot.gke.io/origin-pod"
 PODSNAPSHOT_NAME_ANNOTATION = "podsnapshot.gke.io/ps-name"
 SANDBOX_NAME_HASH_LABEL = "agents.x-k8s.io/sandbox-name-hash"
+SNAPSHOT_TRIGGER_SESSION_LABEL = "agents.x-k8s.io/snapshot-session"
 
 PODSNAPSHOT_API_GROUP = "podsnapshot.gke.io"
 PODSNAPSHOT_API_VERSION = "v1"
@@ -52,3 +54,7 @@ TERMINAL_CLAIM_READY_REASONS = frozenset({
     "ClaimExpired",     # extensions ClaimExpiredReason
     "SandboxExpired",   # core SandboxReasonExpired, forwarded to the claim
 })
+
+# Statuses from a sandbox runtime that does not serve POST /execute_batch;
+# run_many falls back to one /execute request per command on these.
+BATCH_UNSUPPORTED_STATUS_CODES = frozenset({404, 405})
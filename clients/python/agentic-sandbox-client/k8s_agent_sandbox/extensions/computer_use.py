@@ -16,6 +16,7 @@ from ..sandbox_client import SandboxClient
 from ..sandbox import Sandbox
 from ..models import ExecutionResult
 from ..trace_manager import trace_span
+from ..utils import decode_json
 
 class SandboxWithComputerUseSupport(Sandbox):
     @trace_span("agent_query")
@@ -28,7 +29,7 @@ class SandboxWithComputerUseSupport(Sandbox):
 
         response = self.connector.send_request("POST", "agent", json=payload, timeout=timeout)
 
-        response_data = response.json()
+        response_data = decode_json(response.content)
         # Pydantic safely falls back to defaults for any missing keys
         return ExecutionResult(**(response_data or {}))
 
@@ -13,11 +13,15 @@
 # limitations under the License.
 
 import logging
+import os
 import urllib.parse
+from contextlib import nullcontext
+from typing import BinaryIO
 
 from k8s_agent_sandbox.async_connector import AsyncSandboxConnector
 from k8s_agent_sandbox.files.filesystem import Filesystem
 from k8s_agent_sandbox.models import FileEntry
+from k8s_agent_sandbox.utils import decode_json
 from k8s_agent_sandbox.trace_manager import async_trace_span, trace
 
 
@@ -34,14 +38,22 @@ class AsyncFilesystem:
     @async_trace_span("write")
     async def write(
         self,
-        path: str, content: bytes | str,
+        path: str, content: bytes | str | BinaryIO | os.PathLike,
         timeout: int = 60,
         allow_unsafe_paths: bool = False,
     ):
+        """Uploads ``content`` to ``path`` in the sandbox; see ``Filesystem.write``.
+
+        httpx reads file objects (and local paths, opened here) in chunks
+        while sending, so large uploads are not held in memory. A file object
+        is rewound and sent from its start on every attempt, including a
+        retry after a 502/503/504.
+        """
         span = trace.get_current_span()
         if span.is_recording():
             span.set_attribute("sandbox.file.path", path)
-            span.set_attribute("sandbox.file.size", len(content))
+            if isinstance(content, (bytes, str)):
+                span.set_attribute("sandbox.file.size", len(content))
 
         if isinstance(content, str):
             content = content.encode("utf-8")
@@ -54,10 +66,14 @@ class AsyncFilesystem:
         # runtime's C layer.
         if not allow_unsafe_paths:
             path = Filesystem._safe_upload_path(path)
-        files_payload = {"file": (path, content)}
-        await self.connector.send_request(
-            "POST", "upload", files=files_payload, timeout=timeout
-        )
+        if not isinstance(content, (bytes, os.PathLike)):
+            Filesystem._rewind_upload_source(content)
+        source = open(content, "rb") if isinstance(content, os.PathLike) else nullcontext(content)
+        with source as payload:
+            files_payload = {"file": (path, payload)}
+            await self.connector.send_request(
+                "POST", "upload", files=files_payload, timeout=timeout
+            )
         logging.info(f"File '{path}' uploaded successfully.")
 
     @async_trace_span("read")
@@ -66,20 +82,39 @@ class AsyncFilesystem:
         path: str,
         timeout: int = 60,
         allow_unsafe_paths: bool = False,
-    ) -> bytes:
+        out: BinaryIO | None = None,
+        chunk_size: int = 65536,
+    ) -> bytes | None:
+        """Downloads a file from the sandbox; see ``Filesystem.read``."""
         span = trace.get_current_span()
-        if span.is_recording():
+        recording = span.is_recording()
+        if recording:
             span.set_attribute("sandbox.file.path", path)
 
         if not allow_unsafe_paths:
             path = Filesystem._safe_upload_path(path)
         encoded_path = urllib.parse.quote(path, safe="")
+        if out is not None:
+            response = await self.connector.send_request(
+                "GET", f"download/{encoded_path}", timeout=timeout, stream=True
+            )
+            size = 0
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    out.write(chunk)
+                    size += len(chunk)
+            finally:
+                await response.aclose()
+            if recording:
+                span.set_attribute("sandbox.file.size", size)
+            return None
+
         response = await self.connector.send_request(
             "GET", f"download/{encoded_path}", timeout=timeout
         )
         content = response.content
 
-        if span.is_recording():
+        if recording:
             span.set_attribute("sandbox.file.size", len(content))
 
         return content
@@ -87,7 +122,8 @@ class AsyncFilesystem:
     @async_trace_span("list")
     async def list(self, path: str, timeout: int = 60) -> list[FileEntry]:
         span = trace.get_current_span()
-        if span.is_recording():
+        recording = span.is_recording()
+        if recording:
             span.set_attribute("sandbox.file.path", path)
         encoded_path = urllib.parse.quote(path, safe="")
         response = await self.connector.send_request(
@@ -95,7 +131,7 @@ class AsyncFilesystem:
         )
 
         try:
-            entries = response.json()
+            entries = decode_json(response.content)
         except ValueError as e:
             raise RuntimeError(
                 f"Failed to decode JSON response from sandbox: {response.text}"
@@ -111,14 +147,15 @@ class AsyncFilesystem:
                 f"Server returned invalid file entry format: {entries}"
             ) from e
 
-        if span.is_recording():
+        if recording:
             span.set_attribute("sandbox.file.count", len(file_entries))
         return file_entries
 
     @async_trace_span("exists")
     async def exists(self, path: str, timeout: int = 60) -> bool:
         span = trace.get_current_span()
-        if span.is_recording():
+        recording = span.is_recording()
+        if recording:
             span.set_attribute("sandbox.file.path", path)
         encoded_path = urllib.parse.quote(path, safe="")
         response = await self.connector.send_request(
@@ -126,13 +163,13 @@ class AsyncFilesystem:
         )
 
         try:
-            response_data = response.json()
+            response_data = decode_json(response.content)
         except ValueError as e:
             raise RuntimeError(
                 f"Failed to decode JSON response from sandbox: {response.text}"
             ) from e
 
         exists = response_data.get("exists", False)
-        if span.is_recording():
+        if recording:
             span.set_attribute("sandbox.file.exists", exists)
         return exists
@@ -12,14 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import logging
 import os
 import posixpath
 import urllib.parse
-from typing import List
+from contextlib import nullcontext
+from typing import BinaryIO, List
 from k8s_agent_sandbox.connector import SandboxConnector
 from k8s_agent_sandbox.models import FileEntry
+from k8s_agent_sandbox.utils import decode_json
 from k8s_agent_sandbox.trace_manager import trace_span, trace
 
 class Filesystem:
@@ -34,14 +35,23 @@ class Filesystem:
     @trace_span("write")
     def write(
         self,
-        path: str, content: bytes | str,
+        path: str, content: bytes | str | BinaryIO | os.PathLike,
         timeout: int = 60,
         allow_unsafe_paths: bool = False,
     ):
+        """Uploads ``content`` to ``path`` in the sandbox.
+
+        ``content`` may be text, bytes, a local path or a seekable binary file
+        object. A file object is always uploaded from its start, whatever its
+        current position, matching ``AsyncFilesystem.write``; non-seekable
+        streams raise ``ValueError``. requests reads the file in full to build
+        the multipart body, so sync uploads are held in memory.
+        """
         span = trace.get_current_span()
         if span.is_recording():
             span.set_attribute("sandbox.file.path", path)
-            span.set_attribute("sandbox.file.size", len(content))
+            if isinstance(content, (bytes, str)):
+                span.set_attribute("sandbox.file.size", len(content))
 
         if isinstance(content, str):
             content = content.encode('utf-8')
@@ -56,11 +66,30 @@ class Filesystem:
         if not allow_unsafe_paths:
             path = self._safe_upload_path(path)
 
-        files_payload = {'file': (path, content)}
-        self.connector.send_request("POST", "upload",
-                      files=files_payload, timeout=timeout)
+        if not isinstance(content, (bytes, os.PathLike)):
+            self._rewind_upload_source(content)
+        source = open(content, 'rb') if isinstance(content, os.PathLike) else nullcontext(content)
+        with source as payload:
+            files_payload = {'file': (path, payload)}
+            self.connector.send_request("POST", "upload",
+                          files=files_payload, timeout=timeout)
         logging.info(f"File '{path}' uploaded successfully.")
 
+    @staticmethod
+    def _rewind_upload_source(fileobj: BinaryIO) -> None:
+        """Seeks an upload file object back to its start.
+
+        httpx rewinds the file before every attempt, including retries after
+        a 5xx, so both clients upload it from the start. A pipe or socket
+        cannot rewind and would be resent empty on a retry, so it is rejected.
+        """
+        if not (getattr(fileobj, "seekable", None) and fileobj.seekable()):
+            raise ValueError(
+                "File objects passed to write() must be seekable; read the "
+                "stream into bytes first."
+            )
+        fileobj.seek(0)
+
     @staticmethod
     def _safe_upload_path(path: str) -> str:
         """Return a relative, ``..``-free filename safe to send as multipart filename.
@@ -97,21 +126,41 @@ class Filesystem:
         path: str,
         timeout: int = 60,
         allow_unsafe_paths: bool = False,
-
-    ) -> bytes:
+        out: BinaryIO | None = None,
+        chunk_size: int = 65536,
+    ) -> bytes | None:
+        """Downloads a file from the sandbox.
+
+        Returns the file contents, or writes them to ``out`` in
+        ``chunk_size`` pieces and returns None when a binary file object is
+        given, so large downloads are never held in memory in full.
+        """
         span = trace.get_current_span()
-        if span.is_recording():
+        recording = span.is_recording()
+        if recording:
             span.set_attribute("sandbox.file.path", path)
 
         if not allow_unsafe_paths:
             path = self._safe_upload_path(path)
 
         encoded_path = urllib.parse.quote(path, safe='')
+        if out is not None:
+            response = self.connector.send_request(
+                "GET", f"download/{encoded_path}", timeout=timeout, stream=True)
+            size = 0
+            with response:
+                for chunk in response.iter_content(chunk_size):
+                    out.write(chunk)
+                    size += len(chunk)
+            if recording:
+                span.set_attribute("sandbox.file.size", size)
+            return None
+
         response = self.connector.send_request(
             "GET", f"download/{encoded_path}", timeout=timeout)
         content = response.content
 
-        if span.is_recording():
+        if recording:
             span.set_attribute("sandbox.file.size", len(content))
 
         return content
@@ -119,13 +168,14 @@ class Filesystem:
     @trace_span("list")
     def list(self, path: str, timeout: int = 60) -> List[FileEntry]:
         span = trace.get_current_span()
-        if span.is_recording():
+        recording = span.is_recording()
+        if recording:
             span.set_attribute("sandbox.file.path", path)
         encoded_path = urllib.parse.quote(path, safe='')
         response = self.connector.send_request("GET", f"list/{encoded_path}", timeout=timeout)
 
         try:
-            entries = response.json()
+            entries = decode_json(response.content)
         except ValueError as e:
             raise RuntimeError(f"Failed to decode JSON response from sandbox: {response.text}") from e
 
@@ -137,24 +187,25 @@ class Filesystem:
         except Exception as e:
             raise RuntimeError(f"Server returned invalid file entry format: {entries}") from e
 
-        if span.is_recording():
+        if recording:
             span.set_attribute("sandbox.file.count", len(file_entries))
         return file_entries
 
     @trace_span("exists")
     def exists(self, path: str, timeout: int = 60) -> bool:
         span = trace.get_current_span()
-        if span.is_recording():
+        recording = span.is_recording()
+        if recording:
             span.set_attribute("sandbox.file.path", path)
         encoded_path = urllib.parse.quote(path, safe='')
         response = self.connector.send_request("GET", f"exists/{encoded_path}", timeout=timeout)
         
         try:
-            response_data = response.json()
+            response_data = decode_json(response.content)
         except ValueError as e:
             raise RuntimeError(f"Failed to decode JSON response from sandbox: {response.text}") from e
             
         exists = response_data.get("exists", False)
-        if span.is_recording():
+        if recording:
             span.set_attribute("sandbox.file.exists", exists)
         return exists
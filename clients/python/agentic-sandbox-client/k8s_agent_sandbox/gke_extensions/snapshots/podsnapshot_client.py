@@ -21,6 +21,17 @@ from k8s_agent_sandbox.constants import (
 from k8s_agent_sandbox.sandbox_client import SandboxClient
 from .sandbox_with_snapshot_support import SandboxWithSnapshotSupport
 
+# API servers on which the PodSnapshot CRD has already been discovered. CRDs
+# are cluster-scoped and rarely removed, so every client created later in the
+# process skips the discovery round-trip. Only positive results are cached.
+_crd_installed_hosts: set[str] = set()
+
+
+def _api_server_host(k8s_helper) -> str | None:
+    api_client = getattr(k8s_helper.custom_objects_api, "api_client", None)
+    return getattr(getattr(api_client, "configuration", None), "host", None)
+
+
 class PodSnapshotSandboxClient(SandboxClient[SandboxWithSnapshotSupport]):
     """
     A specialized Sandbox client for managing Sandboxes with Pod Snapshot feature.
@@ -46,6 +57,9 @@ class PodSnapshotSandboxClient(SandboxClient[SandboxWithSnapshotSupport]):
     def _check_snapshot_crd_installed(self) -> bool:
         if getattr(self, "snapshot_crd_installed", False):
             return True
+        host = _api_server_host(self.k8s_helper)
+        if host is not None and host in _crd_installed_hosts:
+            return True
         try:
             resource_list = self.k8s_helper.custom_objects_api.get_api_resources(
                 group=PODSNAPSHOT_API_GROUP,
@@ -55,6 +69,8 @@ class PodSnapshotSandboxClient(SandboxClient[SandboxWithSnapshotSupport]):
                 return False
             for resource in resource_list.resources:
                 if resource.kind == PODSNAPSHOT_API_KIND:
+                    if host is not None:
+                        _crd_installed_hosts.add(host)
                     return True
             return False
         except ApiException as e:
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import logging
 import uuid
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Literal
 from datetime import datetime, timezone
 from kubernetes.client import ApiException
@@ -28,11 +30,22 @@ from k8s_agent_sandbox.constants import (
     PODSNAPSHOT_API_VERSION,
     PODSNAPSHOTMANUALTRIGGER_API_KIND,
     PODSNAPSHOTMANUALTRIGGER_PLURAL,
+    SNAPSHOT_TRIGGER_SESSION_LABEL,
+)
+from .utils import (
+    call_with_retry,
+    wait_for_snapshot_to_be_completed,
+    wait_for_snapshot_deletion,
+    normalize_datetime,
 )
-from .utils import wait_for_snapshot_to_be_completed, wait_for_snapshot_deletion, normalize_datetime
 
 SNAPSHOT_SUCCESS_CODE = 0
 SNAPSHOT_ERROR_CODE = 1
+# Stays below the shared ApiClient's minimum connection pool size.
+MAX_PARALLEL_TRIGGER_DELETES = 16
+SNAPSHOT_LIST_PAGE_SIZE = 500
+# Each snapshot delete holds a watch open while it waits for confirmation.
+MAX_PARALLEL_SNAPSHOT_DELETES = 8
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +118,13 @@ class SnapshotEngine:
         self.get_pod_name_func = get_pod_name_func
         self.get_sandbox_name_hash_func = get_sandbox_name_hash_func
         self.created_manual_triggers = []
+        # Labels every trigger this engine creates so cleanup can remove them
+        # with a single DeleteCollection call.
+        self.session_id = uuid.uuid4().hex
+        # Trigger name suffixes count up from a random 32-bit start, so they
+        # are unique within this engine and unlikely to collide across engines
+        # without drawing fresh randomness per snapshot.
+        self._trigger_suffixes = itertools.count(int(self.session_id[:8], 16))
 
     def create(
         self, trigger_name: str, podsnapshot_timeout: int = 180
@@ -113,7 +133,7 @@ class SnapshotEngine:
         Creates a snapshot of the Sandbox.
         """
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-        suffix = uuid.uuid4().hex[:8]
+        suffix = f"{next(self._trigger_suffixes) & 0xFFFFFFFF:08x}"
         # Sanitize to comply with Kubernetes resource name rules
         safe_trigger_name = trigger_name.lower().replace("_", "-")
 
@@ -128,19 +148,24 @@ class SnapshotEngine:
         manifest = {
             "apiVersion": f"{PODSNAPSHOT_API_GROUP}/{PODSNAPSHOT_API_VERSION}",
             "kind": f"{PODSNAPSHOTMANUALTRIGGER_API_KIND}",
-            "metadata": {"name": trigger_name, "namespace": self.namespace},
+            "metadata": {
+                "name": trigger_name,
+                "namespace": self.namespace,
+                "labels": {SNAPSHOT_TRIGGER_SESSION_LABEL: self.session_id},
+            },
             "spec": {"targetPod": self.get_pod_name_func()},
         }
 
         try:
-            pod_snapshot_manual_trigger_cr = (
-                self.k8s_helper.custom_objects_api.create_namespaced_custom_object(
-                    group=PODSNAPSHOT_API_GROUP,
-                    version=PODSNAPSHOT_API_VERSION,
-                    namespace=self.namespace,
-                    plural=PODSNAPSHOTMANUALTRIGGER_PLURAL,
-                    body=manifest,
-                )
+            # Only 429 is safe to retry: a 5xx may have created the trigger.
+            pod_snapshot_manual_trigger_cr = call_with_retry(
+                self.k8s_helper.custom_objects_api.create_namespaced_custom_object,
+                group=PODSNAPSHOT_API_GROUP,
+                version=PODSNAPSHOT_API_VERSION,
+                namespace=self.namespace,
+                plural=PODSNAPSHOTMANUALTRIGGER_PLURAL,
+                body=manifest,
+                retry_statuses=frozenset((429,)),
             )
             self.created_manual_triggers.append(trigger_name)
         except ApiException as e:
@@ -219,8 +244,60 @@ class SnapshotEngine:
                 error_code=SNAPSHOT_ERROR_CODE,
             )
 
+    def _delete_manual_trigger(
+        self, trigger_name: str, attempt: int, max_retries: int
+    ) -> bool:
+        """Deletes one manual trigger; returns False if it should be retried."""
+        try:
+            self.k8s_helper.custom_objects_api.delete_namespaced_custom_object(
+                group=PODSNAPSHOT_API_GROUP,
+                version=PODSNAPSHOT_API_VERSION,
+                namespace=self.namespace,
+                plural=PODSNAPSHOTMANUALTRIGGER_PLURAL,
+                name=trigger_name,
+            )
+            logger.info(f"Deleted PodSnapshotManualTrigger '{trigger_name}'")
+        except ApiException as e:
+            if e.status == 404:
+                # Ignore if the resource is already deleted
+                return True
+            logger.error(
+                f"Attempt {attempt}/{max_retries}: Failed to delete PodSnapshotManualTrigger '{trigger_name}': {e}"
+            )
+            return False
+        except Exception as e:
+            logger.error(
+                f"Attempt {attempt}/{max_retries}: Unexpected error while deleting PodSnapshotManualTrigger '{trigger_name}': {e}"
+            )
+            return False
+        return True
+
     def delete_manual_triggers(self, max_retries: int = 3):
         """Cleans up the manual trigger related resources created by this Sandbox."""
+        if not self.created_manual_triggers:
+            return
+
+        try:
+            self.k8s_helper.custom_objects_api.delete_collection_namespaced_custom_object(
+                group=PODSNAPSHOT_API_GROUP,
+                version=PODSNAPSHOT_API_VERSION,
+                namespace=self.namespace,
+                plural=PODSNAPSHOTMANUALTRIGGER_PLURAL,
+                label_selector=f"{SNAPSHOT_TRIGGER_SESSION_LABEL}={self.session_id}",
+            )
+            logger.info(
+                f"Deleted {len(self.created_manual_triggers)} PodSnapshotManualTrigger(s) "
+                f"for session '{self.session_id}'"
+            )
+            self.created_manual_triggers = []
+            return
+        except Exception as e:
+            # Fall back to deleting by name, e.g. if the API server does not
+            # allow DeleteCollection (405) for this resource.
+            logger.warning(
+                f"Batch delete of PodSnapshotManualTriggers failed, deleting individually: {e}"
+            )
+
         remaining_triggers = list(self.created_manual_triggers)
 
         for attempt in range(1, max_retries + 1):
@@ -228,31 +305,19 @@ class SnapshotEngine:
                 break
 
             current_batch = remaining_triggers
-            remaining_triggers = []
-
-            for trigger_name in current_batch:
-                try:
-                    self.k8s_helper.custom_objects_api.delete_namespaced_custom_object(
-                        group=PODSNAPSHOT_API_GROUP,
-                        version=PODSNAPSHOT_API_VERSION,
-                        namespace=self.namespace,
-                        plural=PODSNAPSHOTMANUALTRIGGER_PLURAL,
-                        name=trigger_name,
-                    )
-                    logger.info(f"Deleted PodSnapshotManualTrigger '{trigger_name}'")
-                except ApiException as e:
-                    if e.status == 404:
-                        # Ignore if the resource is already deleted
-                        continue
-                    logger.error(
-                        f"Attempt {attempt}/{max_retries}: Failed to delete PodSnapshotManualTrigger '{trigger_name}': {e}"
-                    )
-                    remaining_triggers.append(trigger_name)
-                except Exception as e:
-                    logger.error(
-                        f"Attempt {attempt}/{max_retries}: Unexpected error while deleting PodSnapshotManualTrigger '{trigger_name}': {e}"
+            # Each delete is an independent API round-trip, so overlap them.
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_PARALLEL_TRIGGER_DELETES, len(current_batch))
+            ) as pool:
+                deleted = list(
+                    pool.map(
+                        lambda name: self._delete_manual_trigger(name, attempt, max_retries),
+                        current_batch,
                     )
-                    remaining_triggers.append(trigger_name)
+                )
+            remaining_triggers = [
+                name for name, ok in zip(current_batch, deleted) if not ok
+            ]
 
             if remaining_triggers and attempt < max_retries:
                 time.sleep(1)  # Brief pause before retrying
@@ -266,6 +331,27 @@ class SnapshotEngine:
                 "These resources may be leaked in Kubernetes and require manual cleanup."
             )
 
+    def _list_snapshot_items(self, label_selector: str) -> list[dict]:
+        """Fetches all PodSnapshots matching the label selector, one page at a time."""
+        items = []
+        continue_token = None
+        while True:
+            kwargs = {"_continue": continue_token} if continue_token else {}
+            response = call_with_retry(
+                self.k8s_helper.custom_objects_api.list_namespaced_custom_object,
+                group=PODSNAPSHOT_API_GROUP,
+                version=PODSNAPSHOT_API_VERSION,
+                namespace=self.namespace,
+                plural=PODSNAPSHOT_PLURAL,
+                label_selector=label_selector,
+                limit=SNAPSHOT_LIST_PAGE_SIZE,
+                **kwargs,
+            )
+            items.extend(response.get("items") or [])
+            continue_token = (response.get("metadata") or {}).get("continue")
+            if not continue_token:
+                return items
+
     def list(
         self, filter_by: SnapshotFilter | dict | None = None
     ) -> ListSnapshotResult:
@@ -318,26 +404,16 @@ class SnapshotEngine:
 
         logger.info(f"Listing snapshots with label selector: {label_selector}")
         try:
-            # Fetch the PodSnapshots using label selector directly
-            response = self.k8s_helper.custom_objects_api.list_namespaced_custom_object(
-                group=PODSNAPSHOT_API_GROUP,
-                version=PODSNAPSHOT_API_VERSION,
-                namespace=self.namespace,
-                plural=PODSNAPSHOT_PLURAL,
-                label_selector=label_selector,
-            )
-
-            for snapshot in response.get("items") or []:
+            for snapshot in self._list_snapshot_items(label_selector):
                 status = snapshot.get("status") or {}
                 conditions = status.get("conditions") or []
                 metadata = snapshot.get("metadata") or {}
 
                 # Check for Ready=True
-                is_ready = False
-                for cond in conditions:
-                    if cond.get("type") == "Ready" and cond.get("status") == "True":
-                        is_ready = True
-                        break
+                is_ready = any(
+                    cond.get("type") == "Ready" and cond.get("status") == "True"
+                    for cond in conditions
+                )
                 # Skip if only ready snapshots are requested
                 if filter_by.ready_only and not is_ready:
                     continue
@@ -412,6 +488,68 @@ class SnapshotEngine:
             error_code=SNAPSHOT_SUCCESS_CODE,
         )
 
+    def _delete_snapshot(self, uid: str, timeout: int) -> tuple[bool, str | None]:
+        """Deletes one PodSnapshot and waits for it to disappear.
+
+        Returns whether the deletion was confirmed and an error message, if any.
+        A snapshot that is already gone is neither deleted nor an error.
+        """
+        attempts = 0
+
+        def delete():
+            nonlocal attempts
+            attempts += 1
+            return self.k8s_helper.custom_objects_api.delete_namespaced_custom_object(
+                group=PODSNAPSHOT_API_GROUP,
+                version=PODSNAPSHOT_API_VERSION,
+                namespace=self.namespace,
+                plural=PODSNAPSHOT_PLURAL,
+                name=uid,
+            )
+
+        try:
+            logger.info(f"Deleting PodSnapshot '{uid}'...")
+            delete_resp = call_with_retry(delete)
+            logger.info(
+                f"PodSnapshot '{uid}' deletion requested. Waiting for confirmation..."
+            )
+
+            resource_version = None
+            if isinstance(delete_resp, dict):
+                resource_version = delete_resp.get("metadata", {}).get(
+                    "resourceVersion"
+                )
+
+            if wait_for_snapshot_deletion(
+                k8s_helper=self.k8s_helper,
+                namespace=self.namespace,
+                snapshot_uid=uid,
+                resource_version=resource_version,
+                timeout=timeout,
+            ):
+                return True, None
+            msg = f"Timed out waiting for confirmation of deletion for snapshot '{uid}'"
+            logger.error(msg)
+            return False, msg
+        except ApiException as e:
+            if e.status == 404:
+                if attempts > 1:
+                    # An earlier attempt answered 5xx after the API server
+                    # had already acted on it.
+                    logger.info(f"PodSnapshot '{uid}' deleted by a retried request.")
+                    return True, None
+                logger.info(
+                    f"PodSnapshot '{uid}' not found in K8s (already deleted?)."
+                )
+                return False, None
+            msg = f"Failed to delete PodSnapshot '{uid}': {e}"
+            logger.error(msg)
+            return False, msg
+        except Exception as e:
+            msg = f"Unexpected error deleting PodSnapshot '{uid}': {e}"
+            logger.exception(msg)
+            return False, msg
+
     def _execute_deletion(
         self,
         snapshot_uid: str | None = None,
@@ -454,53 +592,21 @@ class SnapshotEngine:
 
         deleted_snapshots = []
         errors = []
-        for uid in snapshots_to_delete:
-            try:
-                logger.info(f"Deleting PodSnapshot '{uid}'...")
-                delete_resp = (
-                    self.k8s_helper.custom_objects_api.delete_namespaced_custom_object(
-                        group=PODSNAPSHOT_API_GROUP,
-                        version=PODSNAPSHOT_API_VERSION,
-                        namespace=self.namespace,
-                        plural=PODSNAPSHOT_PLURAL,
-                        name=uid,
-                    )
+        # Each delete waits for its own confirmation, so overlap them.
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_PARALLEL_SNAPSHOT_DELETES, len(snapshots_to_delete))
+        ) as pool:
+            outcomes = list(
+                pool.map(
+                    lambda uid: self._delete_snapshot(uid, timeout),
+                    snapshots_to_delete,
                 )
-                logger.info(
-                    f"PodSnapshot '{uid}' deletion requested. Waiting for confirmation..."
-                )
-
-                resource_version = None
-                if isinstance(delete_resp, dict):
-                    resource_version = delete_resp.get("metadata", {}).get(
-                        "resourceVersion"
-                    )
-
-                if wait_for_snapshot_deletion(
-                    k8s_helper=self.k8s_helper,
-                    namespace=self.namespace,
-                    snapshot_uid=uid,
-                    resource_version=resource_version,
-                    timeout=timeout,
-                ):
-                    deleted_snapshots.append(uid)
-                else:
-                    msg = f"Timed out waiting for confirmation of deletion for snapshot '{uid}'"
-                    logger.error(msg)
-                    errors.append(msg)
-            except ApiException as e:
-                if e.status == 404:
-                    logger.info(
-                        f"PodSnapshot '{uid}' not found in K8s (already deleted?)."
-                    )
-                else:
-                    msg = f"Failed to delete PodSnapshot '{uid}': {e}"
-                    logger.error(msg)
-                    errors.append(msg)
-            except Exception as e:
-                msg = f"Unexpected error deleting PodSnapshot '{uid}': {e}"
-                logger.exception(msg)
-                errors.append(msg)
+            )
+        for uid, (deleted, error) in zip(snapshots_to_delete, outcomes):
+            if deleted:
+                deleted_snapshots.append(uid)
+            if error:
+                errors.append(error)
 
         logger.info(
             f"Snapshot deletion process completed. Deleted {len(deleted_snapshots)} snapshots."
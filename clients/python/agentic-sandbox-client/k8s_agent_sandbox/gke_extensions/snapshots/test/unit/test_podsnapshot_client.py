@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import unittest
-import logging
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 from kubernetes.client import ApiException
+
 from k8s_agent_sandbox.gke_extensions.snapshots.podsnapshot_client import (
     PodSnapshotSandboxClient,
+    _crd_installed_hosts,
 )
 from k8s_agent_sandbox.gke_extensions.snapshots.sandbox_with_snapshot_support import (
     SandboxWithSnapshotSupport,
@@ -28,85 +31,132 @@ from k8s_agent_sandbox.constants import (
     PODSNAPSHOT_API_VERSION,
 )
 
-logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.unit
 
 
-class TestPodSnapshotSandboxClient(unittest.TestCase):
-    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
-    def test_init_crd_installed_success(self, mock_k8s_helper_cls):
-        mock_k8s_helper = mock_k8s_helper_cls.return_value
-        mock_resource_list = MagicMock()
-        mock_resource = MagicMock()
-        mock_resource.kind = PODSNAPSHOT_API_KIND
-        mock_resource_list.resources = [mock_resource]
-        mock_k8s_helper.custom_objects_api.get_api_resources.return_value = mock_resource_list
-        
-        client = PodSnapshotSandboxClient()
-        
-        self.assertTrue(client.snapshot_crd_installed)
-        mock_k8s_helper.custom_objects_api.get_api_resources.assert_called_with(
-            group=PODSNAPSHOT_API_GROUP, version=PODSNAPSHOT_API_VERSION
+def _resource_list(*kinds):
+    return SimpleNamespace(resources=[SimpleNamespace(kind=kind) for kind in kinds])
+
+
+@pytest.fixture(scope="module")
+def client():
+    """A client built once for the module, with CRD discovery stubbed out."""
+    with patch("k8s_agent_sandbox.sandbox_client.K8sHelper"), patch.object(
+        PodSnapshotSandboxClient, "_check_snapshot_crd_installed", return_value=True
+    ):
+        yield PodSnapshotSandboxClient()
+
+
+@pytest.fixture(autouse=True)
+def reset_client(request):
+    """Clears call history and stubbed behaviour left on the shared client."""
+    yield
+    if "client" in request.fixturenames:
+        request.getfixturevalue("client").k8s_helper.reset_mock(
+            return_value=True, side_effect=True
         )
-        
-    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
-    def test_init_crd_not_installed_failure(self, mock_k8s_helper_cls):
-        mock_k8s_helper = mock_k8s_helper_cls.return_value
-        mock_k8s_helper.custom_objects_api.get_api_resources.return_value = None
-        
-        with self.assertRaises(RuntimeError) as context:
-            PodSnapshotSandboxClient()
-            
-        self.assertIn("Pod Snapshot Controller is not ready", str(context.exception))
-        
-    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
-    def test_init_crd_api_exception(self, mock_k8s_helper_cls):
+
+
+@pytest.fixture
+def mock_k8s_helper():
+    """The K8sHelper a freshly constructed client will receive."""
+    with patch("k8s_agent_sandbox.sandbox_client.K8sHelper") as mock_k8s_helper_cls:
         mock_k8s_helper = mock_k8s_helper_cls.return_value
-        mock_k8s_helper.custom_objects_api.get_api_resources.side_effect = ApiException(status=500)
-        
-        with self.assertRaises(ApiException):
-            PodSnapshotSandboxClient()
-            
-    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
-    @patch.object(PodSnapshotSandboxClient, '_check_snapshot_crd_installed', return_value=True)
-    def test_sandbox_class(self, mock_check, mock_k8s_helper_cls):
-        client = PodSnapshotSandboxClient()
-        self.assertEqual(client.sandbox_class, SandboxWithSnapshotSupport)
-        
-    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
-    @patch.object(PodSnapshotSandboxClient, '_check_snapshot_crd_installed', return_value=True)
-    @patch('k8s_agent_sandbox.sandbox_client.SandboxClient.create_sandbox')
-    def test_create_sandbox(self, mock_super_create, mock_check, mock_k8s_helper_cls):
-        client = PodSnapshotSandboxClient()
+        # Discovery is the only API call the client makes on construction.
+        mock_k8s_helper.custom_objects_api = Mock(spec=["get_api_resources"])
+        yield mock_k8s_helper
+
+
+def test_init_crd_installed_success(mock_k8s_helper):
+    mock_k8s_helper.custom_objects_api.get_api_resources.return_value = _resource_list(
+        PODSNAPSHOT_API_KIND
+    )
+
+    client = PodSnapshotSandboxClient()
+
+    assert client.snapshot_crd_installed
+    mock_k8s_helper.custom_objects_api.get_api_resources.assert_called_with(
+        group=PODSNAPSHOT_API_GROUP, version=PODSNAPSHOT_API_VERSION
+    )
+
+
+def test_crd_discovery_is_cached_per_api_server(mock_k8s_helper):
+    mock_k8s_helper.custom_objects_api.api_client = SimpleNamespace(
+        configuration=SimpleNamespace(host="https://cached.example:443")
+    )
+    mock_k8s_helper.custom_objects_api.get_api_resources.return_value = _resource_list(
+        PODSNAPSHOT_API_KIND
+    )
+
+    try:
+        PodSnapshotSandboxClient()
+        PodSnapshotSandboxClient()
+    finally:
+        _crd_installed_hosts.discard("https://cached.example:443")
+
+    mock_k8s_helper.custom_objects_api.get_api_resources.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "discovery",
+    [
+        pytest.param({"return_value": None}, id="no-resource-list"),
+        pytest.param({"return_value": _resource_list()}, id="no-resources"),
+        pytest.param({"return_value": _resource_list("OtherKind")}, id="kind-mismatch"),
+        pytest.param({"side_effect": ApiException(status=403)}, id="forbidden"),
+        pytest.param({"side_effect": ApiException(status=404)}, id="group-not-found"),
+    ],
+)
+def test_init_crd_not_installed_failure(mock_k8s_helper, discovery):
+    mock_k8s_helper.custom_objects_api.get_api_resources.configure_mock(**discovery)
+
+    with pytest.raises(RuntimeError, match="Pod Snapshot Controller is not ready"):
+        PodSnapshotSandboxClient()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ApiException(status=status) for status in (401, 500, 503)],
+    ids=lambda error: str(error.status),
+)
+def test_init_crd_api_exception(mock_k8s_helper, error):
+    mock_k8s_helper.custom_objects_api.get_api_resources.side_effect = error
+
+    with pytest.raises(ApiException):
+        PodSnapshotSandboxClient()
+
+
+def test_sandbox_class(client):
+    assert client.sandbox_class is SandboxWithSnapshotSupport
+
+
+def test_create_sandbox(client):
+    with patch("k8s_agent_sandbox.sandbox_client.SandboxClient.create_sandbox") as mock_super_create:
         mock_super_create.return_value = MagicMock(spec=SandboxWithSnapshotSupport)
-        
+
         result = client.create_sandbox("test-template", "test-ns")
-        
-        mock_super_create.assert_called_once_with("test-template", "test-ns")
-        self.assertIsInstance(result, SandboxWithSnapshotSupport)
-
-    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
-    @patch.object(PodSnapshotSandboxClient, '_check_snapshot_crd_installed', return_value=True)
-    @patch('k8s_agent_sandbox.sandbox_client.SandboxClient.get_sandbox')
-    def test_get_sandbox(self, mock_super_get, mock_check, mock_k8s_helper_cls):
-        client = PodSnapshotSandboxClient()
+
+    mock_super_create.assert_called_once_with("test-template", "test-ns")
+    assert isinstance(result, SandboxWithSnapshotSupport)
+
+
+def test_get_sandbox(client):
+    with patch("k8s_agent_sandbox.sandbox_client.SandboxClient.get_sandbox") as mock_super_get:
         mock_super_get.return_value = MagicMock(spec=SandboxWithSnapshotSupport)
-        
+
         result = client.get_sandbox("test-id", "test-ns")
-        
-        mock_super_get.assert_called_once_with("test-id", "test-ns")
-        self.assertIsInstance(result, SandboxWithSnapshotSupport)
-
-    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
-    @patch.object(PodSnapshotSandboxClient, '_check_snapshot_crd_installed', return_value=True)
-    @patch('k8s_agent_sandbox.sandbox_client.SandboxClient.list_active_sandboxes')
-    def test_list_active_sandboxes(self, mock_super_list, mock_check, mock_k8s_helper_cls):
-        client = PodSnapshotSandboxClient()
+
+    mock_super_get.assert_called_once_with("test-id", "test-ns")
+    assert isinstance(result, SandboxWithSnapshotSupport)
+
+
+def test_list_active_sandboxes(client):
+    with patch(
+        "k8s_agent_sandbox.sandbox_client.SandboxClient.list_active_sandboxes"
+    ) as mock_super_list:
         mock_super_list.return_value = ["test-id-1", "test-id-2"]
-        
+
         result = client.list_active_sandboxes()
-        
-        mock_super_list.assert_called_once_with()
-        self.assertEqual(result, ["test-id-1", "test-id-2"])
 
-if __name__ == "__main__":
-    unittest.main()
+    mock_super_list.assert_called_once_with()
+    assert result == ["test-id-1", "test-id-2"]
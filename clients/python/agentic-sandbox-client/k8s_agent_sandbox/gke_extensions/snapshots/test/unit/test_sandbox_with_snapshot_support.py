@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import unittest
-import logging
+import threading
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch, call
 from kubernetes.client import ApiException
@@ -23,7 +23,6 @@ from k8s_agent_sandbox.gke_extensions.snapshots.sandbox_with_snapshot_support im
     SUCCESS_CODE,
     ERROR_CODE,
     INTERNAL_ERROR_CODE,
-    SuspendResponse,
     RestorationResponse,
 )
 from k8s_agent_sandbox.exceptions import SnapshotNotFoundError
@@ -33,12 +32,12 @@ from k8s_agent_sandbox.constants import (
     PODSNAPSHOT_API_GROUP,
     PODSNAPSHOT_API_VERSION,
     PODSNAPSHOTMANUALTRIGGER_PLURAL,
-    POD_NAME_ANNOTATION,
     PODSNAPSHOT_PLURAL,
     SANDBOX_API_GROUP,
     SANDBOX_API_VERSION,
     SANDBOX_PLURAL_NAME,
     PODSNAPSHOT_NAME_ANNOTATION,
+    SNAPSHOT_TRIGGER_SESSION_LABEL,
 )
 from k8s_agent_sandbox.gke_extensions.snapshots.snapshot_engine import (
     ListSnapshotResult,
@@ -46,9 +45,12 @@ from k8s_agent_sandbox.gke_extensions.snapshots.snapshot_engine import (
     DeleteSnapshotResult,
     SnapshotResponse,
     SnapshotFilter,
+    SNAPSHOT_LIST_PAGE_SIZE,
+)
+from k8s_agent_sandbox.gke_extensions.snapshots.utils import (
+    API_MAX_RETRIES,
+    call_with_retry,
 )
-
-logger = logging.getLogger(__name__)
 
 
 class TestSandboxWithSnapshotSupport(unittest.TestCase):
@@ -57,7 +59,6 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
     @patch("k8s_agent_sandbox.sandbox.CommandExecutor")
     @patch("k8s_agent_sandbox.sandbox.Filesystem")
     def setUp(self, mock_fs, mock_ce, mock_ctm, mock_conn):
-        logging.info(f"Starting {self._testMethodName}...")
         mock_ctm.return_value = (None, None)
 
         self.mock_k8s_helper = MagicMock()
@@ -79,8 +80,13 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
         
         self.engine.get_sandbox_name_hash_func = MagicMock(return_value="test-hash")
 
-    def tearDown(self):
-        logging.info(f"Finished {self._testMethodName}.")
+        # Retry backoff has its own tests; don't sleep through it here.
+        retry_delay_patcher = patch(
+            "k8s_agent_sandbox.gke_extensions.snapshots.utils._api_retry_delay",
+            return_value=0.0,
+        )
+        retry_delay_patcher.start()
+        self.addCleanup(retry_delay_patcher.stop)
 
     @patch("k8s_agent_sandbox.gke_extensions.snapshots.utils.watch.Watch")
     def test_snapshots_create_success(self, mock_watch_cls):
@@ -125,10 +131,104 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
         )
         self.assertEqual(kwargs["group"], PODSNAPSHOT_API_GROUP)
         self.assertEqual(kwargs["body"]["spec"]["targetPod"], "test-pod")
+        self.assertEqual(
+            kwargs["body"]["metadata"]["labels"],
+            {SNAPSHOT_TRIGGER_SESSION_LABEL: self.engine.session_id},
+        )
 
         mock_watch.stream.assert_called_once()
         _, stream_kwargs = mock_watch.stream.call_args
         self.assertEqual(stream_kwargs.get("resource_version"), "123")
+        self.assertTrue(stream_kwargs.get("allow_watch_bookmarks"))
+
+    def test_snapshots_create_trigger_names_are_unique(self):
+        self.mock_k8s_helper.custom_objects_api.create_namespaced_custom_object.side_effect = (
+            ApiException(status=500)
+        )
+
+        names = [self.engine.create("test-trigger").trigger_name for _ in range(3)]
+
+        self.assertEqual(len(set(names)), 3)
+        for name in names:
+            self.assertRegex(name, r"^test-trigger-\d{8}-\d{6}-[0-9a-f]{8}$")
+
+    @patch("k8s_agent_sandbox.gke_extensions.snapshots.utils.watch.Watch")
+    def test_snapshots_create_restarts_watch_on_410(self, mock_watch_cls):
+        mock_watch = MagicMock()
+        mock_watch_cls.return_value = mock_watch
+
+        complete_event = {
+            "type": "MODIFIED",
+            "object": {
+                "status": {
+                    "conditions": [
+                        {
+                            "type": "Triggered",
+                            "status": "True",
+                            "reason": "Complete",
+                            "lastTransitionTime": "2023-01-01T00:00:00Z",
+                        }
+                    ],
+                    "snapshotCreated": {"name": "snapshot-uid"},
+                }
+            },
+        }
+        mock_watch.stream.side_effect = [ApiException(status=410), [complete_event]]
+        self.mock_k8s_helper.custom_objects_api.create_namespaced_custom_object.return_value = {
+            "metadata": {"resourceVersion": "123"}
+        }
+
+        result = self.engine.create("test-trigger")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.snapshot_uid, "snapshot-uid")
+        versions = [c.kwargs["resource_version"] for c in mock_watch.stream.call_args_list]
+        self.assertEqual(versions, ["123", "0"])
+
+    @patch("k8s_agent_sandbox.gke_extensions.snapshots.utils.watch.Watch")
+    def test_snapshots_create_reconnects_after_idle_close(self, mock_watch_cls):
+        mock_watch = MagicMock()
+        mock_watch_cls.return_value = mock_watch
+
+        pending_event = {
+            "type": "MODIFIED",
+            "object": {
+                "metadata": {"resourceVersion": "456"},
+                "status": {
+                    "conditions": [
+                        {"type": "Triggered", "status": "False", "reason": "Pending"}
+                    ]
+                },
+            },
+        }
+        complete_event = {
+            "type": "MODIFIED",
+            "object": {
+                "status": {
+                    "conditions": [
+                        {
+                            "type": "Triggered",
+                            "status": "True",
+                            "reason": "Complete",
+                            "lastTransitionTime": "2023-01-01T00:00:00Z",
+                        }
+                    ],
+                    "snapshotCreated": {"name": "snapshot-uid"},
+                }
+            },
+        }
+        # The first stream ends without a terminal event, as when the API
+        # server closes an idle watch; the wait should resume from there.
+        mock_watch.stream.side_effect = [[pending_event], [complete_event]]
+        self.mock_k8s_helper.custom_objects_api.create_namespaced_custom_object.return_value = {
+            "metadata": {"resourceVersion": "123"}
+        }
+
+        result = self.engine.create("test-trigger")
+
+        self.assertTrue(result.success)
+        versions = [c.kwargs["resource_version"] for c in mock_watch.stream.call_args_list]
+        self.assertEqual(versions, ["123", "456"])
 
     @patch("k8s_agent_sandbox.gke_extensions.snapshots.utils.watch.Watch")
     def test_snapshots_create_processed_retry(self, mock_watch_cls):
@@ -293,8 +393,26 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
         self.assertIn("Failed to create PodSnapshotManualTrigger", result.error_reason)
         self.assertIn("Invalid value", result.error_reason)
 
+    def test_delete_manual_triggers_uses_delete_collection(self):
+        self.engine.created_manual_triggers = ["trigger-1", "trigger-2"]
+
+        self.engine.delete_manual_triggers()
+
+        self.mock_k8s_helper.custom_objects_api.delete_collection_namespaced_custom_object.assert_called_once_with(
+            group=PODSNAPSHOT_API_GROUP,
+            version=PODSNAPSHOT_API_VERSION,
+            namespace=self.sandbox.namespace,
+            plural=PODSNAPSHOTMANUALTRIGGER_PLURAL,
+            label_selector=f"{SNAPSHOT_TRIGGER_SESSION_LABEL}={self.engine.session_id}",
+        )
+        self.mock_k8s_helper.custom_objects_api.delete_namespaced_custom_object.assert_not_called()
+        self.assertEqual(self.engine.created_manual_triggers, [])
+
     def test_delete_manual_triggers(self):
         self.engine.created_manual_triggers = ["trigger-1", "trigger-2"]
+        self.mock_k8s_helper.custom_objects_api.delete_collection_namespaced_custom_object.side_effect = (
+            ApiException(status=405)
+        )
 
         self.engine.delete_manual_triggers()
 
@@ -324,6 +442,30 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
         )
         self.assertEqual(len(self.engine.created_manual_triggers), 0)
 
+    @patch("k8s_agent_sandbox.gke_extensions.snapshots.snapshot_engine.time.sleep")
+    def test_delete_manual_triggers_retries_only_failures(self, mock_sleep):
+        self.engine.created_manual_triggers = ["trigger-1", "trigger-2", "trigger-3"]
+        api = self.mock_k8s_helper.custom_objects_api
+        api.delete_collection_namespaced_custom_object.side_effect = ApiException(status=405)
+        failures = {"trigger-2": 1, "trigger-3": 3}
+
+        def delete(**kwargs):
+            name = kwargs["name"]
+            if failures.get(name):
+                failures[name] -= 1
+                raise ApiException(status=500)
+
+        api.delete_namespaced_custom_object.side_effect = delete
+
+        self.engine.delete_manual_triggers(max_retries=3)
+
+        names = [c.kwargs["name"] for c in api.delete_namespaced_custom_object.call_args_list]
+        self.assertEqual(names.count("trigger-1"), 1)
+        self.assertEqual(names.count("trigger-2"), 2)
+        self.assertEqual(names.count("trigger-3"), 3)
+        self.assertEqual(self.engine.created_manual_triggers, ["trigger-3"])
+        self.assertEqual(mock_sleep.call_count, 2)
+
     def test_is_restored_from_snapshot_success(self):
         """Test successful identification of restore from snapshot."""
         mock_pod = MagicMock()
@@ -513,6 +655,7 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
             namespace="test-ns",
             plural=PODSNAPSHOT_PLURAL,
             label_selector=f"{SANDBOX_NAME_HASH_LABEL}=test-hash",
+            limit=SNAPSHOT_LIST_PAGE_SIZE,
         )
 
     def test_snapshots_list_filter_empty(self):
@@ -773,8 +916,33 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
             namespace="test-ns",
             plural=PODSNAPSHOT_PLURAL,
             label_selector=f"{SANDBOX_NAME_HASH_LABEL}=test-hash",
+            limit=SNAPSHOT_LIST_PAGE_SIZE,
         )
 
+    def test_snapshots_list_follows_continue_token(self):
+        """Test list snapshots pages through results with the continue token."""
+
+        def _snapshot(name, created):
+            return {
+                "metadata": {"name": name, "creationTimestamp": created},
+                "status": {"conditions": [{"type": "Ready", "status": "True"}]},
+            }
+
+        api = self.mock_k8s_helper.custom_objects_api
+        api.list_namespaced_custom_object.side_effect = [
+            {"items": [_snapshot("snap-1", "2023-01-01T00:00:00Z")], "metadata": {"continue": "page-2"}},
+            {"items": [_snapshot("snap-2", "2023-01-02T00:00:00Z")], "metadata": {}},
+        ]
+
+        result = self.engine.list()
+
+        self.assertTrue(result.success)
+        self.assertEqual([s.snapshot_uid for s in result.snapshots], ["snap-2", "snap-1"])
+        calls = api.list_namespaced_custom_object.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertNotIn("_continue", calls[0].kwargs)
+        self.assertEqual(calls[1].kwargs["_continue"], "page-2")
+
     def test_snapshots_list_no_pod_name(self):
         """Test list snapshots fails when pod name is missing."""
         self.sandbox.get_pod_name.return_value = None
@@ -945,10 +1113,13 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
             self.assertFalse(result.success)
             self.assertEqual(result.deleted_snapshots, ["snap-1", "snap-3"])
             self.assertIn("Failed to delete PodSnapshot 'snap-2'", result.error_reason)
-            self.assertEqual(
-                self.mock_k8s_helper.custom_objects_api.delete_namespaced_custom_object.call_count,
-                3,
-            )
+            deleted_names = [
+                c.kwargs["name"]
+                for c in self.mock_k8s_helper.custom_objects_api.delete_namespaced_custom_object.call_args_list
+            ]
+            self.assertEqual(sorted(set(deleted_names)), ["snap-1", "snap-2", "snap-3"])
+            # The 500 is treated as transient and retried before giving up.
+            self.assertEqual(deleted_names.count("snap-2"), API_MAX_RETRIES + 1)
             # Verify wait was called for successful deletions
             self.assertEqual(mock_wait.call_count, 2)
             mock_wait.assert_has_calls(
@@ -971,6 +1142,37 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
                 any_order=True,
             )
 
+    @patch(
+        "k8s_agent_sandbox.gke_extensions.snapshots.snapshot_engine.wait_for_snapshot_deletion"
+    )
+    def test_snapshots_delete_waits_run_concurrently(self, mock_wait):
+        """Test delete snapshots overlaps the per-snapshot deletion waits."""
+        # Both waits must be in flight at once for the barrier to release.
+        barrier = threading.Barrier(2, timeout=5)
+        mock_wait.side_effect = lambda **kwargs: barrier.wait() is not None
+
+        with patch.object(self.engine, "list") as mock_list:
+            mock_list.return_value = ListSnapshotResult(
+                success=True,
+                snapshots=[
+                    SnapshotDetail(
+                        snapshot_uid=uid,
+                        source_pod="pod",
+                        creation_timestamp="ts",
+                        status="Ready",
+                    )
+                    for uid in ("snap-1", "snap-2")
+                ],
+                error_reason="",
+                error_code=0,
+            )
+            self.mock_k8s_helper.custom_objects_api.delete_namespaced_custom_object.return_value = {}
+
+            result = self.engine.delete_all()
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.deleted_snapshots, ["snap-1", "snap-2"])
+
     @patch(
         "k8s_agent_sandbox.gke_extensions.snapshots.snapshot_engine.wait_for_snapshot_deletion"
     )
@@ -997,6 +1199,20 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
         self.assertEqual(result.deleted_snapshots, [])
         mock_wait.assert_not_called()
 
+    @patch(
+        "k8s_agent_sandbox.gke_extensions.snapshots.snapshot_engine.wait_for_snapshot_deletion"
+    )
+    def test_snapshots_delete_404_after_retry_counts_as_deleted(self, mock_wait):
+        """Test a 404 on retry after a 5xx reports the snapshot as deleted."""
+        self.mock_k8s_helper.custom_objects_api.delete_namespaced_custom_object.side_effect = [
+            ApiException(503, "Unavailable"),
+            ApiException(404, "Not Found"),
+        ]
+        result = self.engine.delete(snapshot_uid="target-snap")
+        self.assertTrue(result.success)
+        self.assertEqual(result.deleted_snapshots, ["target-snap"])
+        mock_wait.assert_not_called()
+
     def test_snapshots_delete_list_fail(self):
         """Test delete snapshots returning early false if list query fails."""
         with patch.object(self.engine, "list") as mock_list:
@@ -1594,5 +1810,38 @@ class TestSandboxWithSnapshotSupport(unittest.TestCase):
             self.sandbox._verify_snapshot_exists("non-existent-snap")
         self.assertIn("Snapshot 'non-existent-snap' does not exist for this sandbox.", str(context.exception))
 
+
+@patch("k8s_agent_sandbox.gke_extensions.snapshots.utils.time.sleep")
+class TestCallWithRetry(unittest.TestCase):
+    def test_retries_throttling_and_honors_retry_after(self, mock_sleep):
+        throttled = ApiException(status=429)
+        throttled.headers = {"Retry-After": "2"}
+        func = MagicMock(side_effect=[throttled, "ok"])
+
+        self.assertEqual(call_with_retry(func, "a", b=1), "ok")
+
+        self.assertEqual(func.call_count, 2)
+        func.assert_called_with("a", b=1)
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        func = MagicMock(side_effect=ApiException(status=503))
+
+        with self.assertRaises(ApiException):
+            call_with_retry(func)
+
+        self.assertEqual(func.call_count, API_MAX_RETRIES + 1)
+        self.assertEqual(mock_sleep.call_count, API_MAX_RETRIES)
+
+    def test_does_not_retry_other_statuses(self, mock_sleep):
+        func = MagicMock(side_effect=ApiException(status=500))
+
+        with self.assertRaises(ApiException):
+            call_with_retry(func, retry_statuses=frozenset((429,)))
+
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -13,9 +13,10 @@
 # limitations under the License.
 
 import logging
+import random
 import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, TypeVar
 from kubernetes.client import ApiException
 from kubernetes import watch
 from pydantic import BaseModel
@@ -32,6 +33,14 @@ logger = logging.getLogger(__name__)
 SNAPSHOT_SUCCESS_CODE = 0
 SNAPSHOT_ERROR_CODE = 1
 
+# API server responses that mean "try again shortly" rather than "no".
+RETRYABLE_API_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+API_MAX_RETRIES = 3
+API_BACKOFF_FACTOR = 0.5
+API_BACKOFF_MAX = 10.0
+
+T = TypeVar("T")
+
 
 class RestoreCheckResult(BaseModel):
     """Result of a restore check operation."""
@@ -48,16 +57,55 @@ class SnapshotResult(BaseModel):
     snapshot_timestamp: str
 
 
+def _api_retry_delay(e: ApiException, previous_delay: float) -> float:
+    """Returns the delay before retrying ``e``, honoring a numeric Retry-After.
+
+    Otherwise uses decorrelated jitter so that clients throttled together do
+    not retry in lockstep.
+    """
+    retry_after = (e.headers or {}).get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(API_BACKOFF_MAX, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(API_BACKOFF_FACTOR, min(API_BACKOFF_MAX, previous_delay * 3))
+
+
+def call_with_retry(
+    func: Callable[..., T],
+    *args,
+    retry_statuses: frozenset[int] = RETRYABLE_API_STATUS_CODES,
+    **kwargs,
+) -> T:
+    """Calls a Kubernetes API function, retrying throttled and transient failures.
+
+    Non-idempotent calls should narrow ``retry_statuses`` to 429, which the API
+    server returns before acting on the request.
+    """
+    delay = API_BACKOFF_FACTOR
+    for attempt in range(API_MAX_RETRIES + 1):
+        try:
+            return func(*args, **kwargs)
+        except ApiException as e:
+            if e.status not in retry_statuses or attempt == API_MAX_RETRIES:
+                raise
+            delay = _api_retry_delay(e, delay)
+            logger.warning(
+                f"Kubernetes API returned {e.status}; retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{API_MAX_RETRIES})"
+            )
+            time.sleep(delay)
+
+
 def _get_snapshot_info(snapshot_obj: dict[str, Any]) -> SnapshotResult:
     """Get the details for Snapshot"""
     status = snapshot_obj.get("status", {})
     conditions = status.get("conditions") or []
-    for condition in conditions:
-        if (
-            condition.get("type") == "Triggered"
-            and condition.get("status") == "True"
-            and condition.get("reason") == "Complete"
-        ):
+    condition = next((c for c in conditions if c.get("type") == "Triggered"), None)
+    if condition is not None:
+        outcome = (condition.get("status"), condition.get("reason"))
+        if outcome == ("True", "Complete"):
             snapshot_created = status.get("snapshotCreated") or {}
             snapshot_uid = snapshot_created.get("name")
             snapshot_timestamp = condition.get("lastTransitionTime")
@@ -65,15 +113,7 @@ def _get_snapshot_info(snapshot_obj: dict[str, Any]) -> SnapshotResult:
                 snapshot_uid=snapshot_uid,
                 snapshot_timestamp=snapshot_timestamp,
             )
-        elif (
-            condition.get("type") == "Triggered"
-            and condition.get("status") == "False"
-            and condition.get("reason")
-            in [
-                "Failed",
-                "Error",
-            ]
-        ):
+        if outcome in (("False", "Failed"), ("False", "Error")):
             raise RuntimeError(
                 f"Snapshot failed. Condition: {condition.get('message', 'Unknown error')}"
             )
@@ -89,50 +129,77 @@ def wait_for_snapshot_to_be_completed(
 ) -> SnapshotResult:
     """
     Waits for the PodSnapshotManualTrigger to be processed and returns SnapshotResult.
+
+    The watch starts from ``resource_version`` (the trigger's create response)
+    or, without one, from ``"0"`` so the apiserver serves the current state
+    from its watch cache instead of a quorum read. Bookmarks are requested so
+    the watch keeps a fresh resourceVersion while the trigger is idle; if the
+    version has been compacted away (410 Gone) the watch restarts from ``"0"``.
+
+    If the connection is closed before ``podsnapshot_timeout`` (e.g. by an
+    idle load balancer), the watch reconnects from the last seen
+    resourceVersion; TimeoutError is only raised once the full timeout passes.
     """
     w = watch.Watch()
     logger.info(
         f"Waiting for snapshot manual trigger '{trigger_name}' to be processed..."
     )
 
-    kwargs = {}
-    if resource_version:
-        kwargs["resource_version"] = resource_version
+    deadline = time.monotonic() + podsnapshot_timeout
+    rv = resource_version or "0"
 
     try:
-        for event in w.stream(
-            func=k8s_helper.custom_objects_api.list_namespaced_custom_object,
-            namespace=namespace,
-            group=PODSNAPSHOT_API_GROUP,
-            version=PODSNAPSHOT_API_VERSION,
-            plural=PODSNAPSHOTMANUALTRIGGER_PLURAL,
-            field_selector=f"metadata.name={trigger_name}",
-            timeout_seconds=podsnapshot_timeout,
-            **kwargs,
-        ):
-            if event is None:
-                continue
-            if event["type"] in ["ADDED", "MODIFIED"]:
-                obj = event["object"]
-                try:
-                    result = _get_snapshot_info(obj)
-                    logger.info(
-                        f"Snapshot manual trigger '{trigger_name}' processed successfully. Created Snapshot UID: {result.snapshot_uid}"
-                    )
-                    return result
-                except ValueError:
-                    # Continue watching if snapshot is not yet complete
-                    continue
-            elif event["type"] == "ERROR":
-                logger.error(f"Snapshot watch received error event: {event['object']}")
-                raise RuntimeError(f"Snapshot watch error: {event['object']}")
-            elif event["type"] == "DELETED":
-                logger.error(
-                    f"Snapshot manual trigger '{trigger_name}' was deleted before completion."
-                )
-                raise RuntimeError(
-                    f"Snapshot manual trigger '{trigger_name}' was deleted."
+        while (remaining := int(deadline - time.monotonic())) > 0:
+            try:
+                for event in w.stream(
+                    func=k8s_helper.custom_objects_api.list_namespaced_custom_object,
+                    namespace=namespace,
+                    group=PODSNAPSHOT_API_GROUP,
+                    version=PODSNAPSHOT_API_VERSION,
+                    plural=PODSNAPSHOTMANUALTRIGGER_PLURAL,
+                    field_selector=f"metadata.name={trigger_name}",
+                    timeout_seconds=remaining,
+                    resource_version=rv,
+                    allow_watch_bookmarks=True,
+                ):
+                    if event is None:
+                        continue
+                    # Track the last-seen resourceVersion (bookmarks included)
+                    # so a reconnect resumes instead of replaying history.
+                    event_obj = event.get("object")
+                    if isinstance(event_obj, dict):
+                        seen_rv = (event_obj.get("metadata") or {}).get("resourceVersion")
+                        if seen_rv:
+                            rv = seen_rv
+                    if event["type"] in ["ADDED", "MODIFIED"]:
+                        obj = event["object"]
+                        try:
+                            result = _get_snapshot_info(obj)
+                            logger.info(
+                                f"Snapshot manual trigger '{trigger_name}' processed successfully. Created Snapshot UID: {result.snapshot_uid}"
+                            )
+                            return result
+                        except ValueError:
+                            # Continue watching if snapshot is not yet complete
+                            continue
+                    elif event["type"] == "ERROR":
+                        logger.error(f"Snapshot watch received error event: {event['object']}")
+                        raise RuntimeError(f"Snapshot watch error: {event['object']}")
+                    elif event["type"] == "DELETED":
+                        logger.error(
+                            f"Snapshot manual trigger '{trigger_name}' was deleted before completion."
+                        )
+                        raise RuntimeError(
+                            f"Snapshot manual trigger '{trigger_name}' was deleted."
+                        )
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                logger.info(
+                    f"Watch on snapshot manual trigger '{trigger_name}' expired "
+                    f"(410 Gone at resourceVersion={rv}); restarting from current state"
                 )
+                rv = "0"
     except Exception as e:
         logger.error(f"Error watching snapshot: {e}")
         raise
@@ -152,7 +219,7 @@ def check_pod_restored_from_snapshot(
 ) -> RestoreCheckResult:
     """Checks if a pod was restored from the provided snapshot."""
     try:
-        pod = k8s_helper.core_v1_api.read_namespaced_pod(pod_name, namespace)
+        pod = call_with_retry(k8s_helper.core_v1_api.read_namespaced_pod, pod_name, namespace)
 
         if not pod.status or not pod.status.conditions:
             return RestoreCheckResult(
@@ -161,36 +228,37 @@ def check_pod_restored_from_snapshot(
                 error_code=SNAPSHOT_ERROR_CODE,
             )
 
-        for condition in pod.status.conditions:
-            if condition.type == "PodRestored":
-                if condition.status == "True":
-                    # Check if Snapshot UID is present in the condition.message
-                    if condition.message and snapshot_uid in condition.message:
-                        return RestoreCheckResult(
-                            success=True,
-                            error_reason="",
-                            error_code=SNAPSHOT_SUCCESS_CODE,
-                        )
-                    else:
-                        return RestoreCheckResult(
-                            success=False,
-                            error_reason=f"Pod was not restored from the given snapshot '{snapshot_uid}'. Actual condition message: '{condition.message}'",
-                            error_code=SNAPSHOT_ERROR_CODE,
-                        )
-                else:
-                    reason_val = condition.reason or ""
-                    msg_val = condition.message or ""
-                    reason = f" reason: '{reason_val}'"
-                    msg = f" message: '{msg_val}'"
-                    return RestoreCheckResult(
-                        success=False,
-                        error_reason=f"Restore attempted but pending or failed (status: '{condition.status}'{reason}{msg})",
-                        error_code=SNAPSHOT_ERROR_CODE,
-                    )
+        condition = next(
+            (c for c in pod.status.conditions if c.type == "PodRestored"), None
+        )
+        if condition is None:
+            return RestoreCheckResult(
+                success=False,
+                error_reason="Pod was started as a fresh instance",
+                error_code=SNAPSHOT_ERROR_CODE,
+            )
 
+        if condition.status != "True":
+            reason_val = condition.reason or ""
+            msg_val = condition.message or ""
+            reason = f" reason: '{reason_val}'"
+            msg = f" message: '{msg_val}'"
+            return RestoreCheckResult(
+                success=False,
+                error_reason=f"Restore attempted but pending or failed (status: '{condition.status}'{reason}{msg})",
+                error_code=SNAPSHOT_ERROR_CODE,
+            )
+
+        # Check if Snapshot UID is present in the condition.message
+        if condition.message and snapshot_uid in condition.message:
+            return RestoreCheckResult(
+                success=True,
+                error_reason="",
+                error_code=SNAPSHOT_SUCCESS_CODE,
+            )
         return RestoreCheckResult(
             success=False,
-            error_reason="Pod was started as a fresh instance",
+            error_reason=f"Pod was not restored from the given snapshot '{snapshot_uid}'. Actual condition message: '{condition.message}'",
             error_code=SNAPSHOT_ERROR_CODE,
         )
 
@@ -13,8 +13,8 @@
 # limitations under the License.
 
 import logging
+import threading
 import time
-from datetime import datetime, UTC
 from typing import List
 from kubernetes import client, config, watch
 from .exceptions import SandboxClaimFailedError, SandboxMetadataError, SandboxNotFoundError, SandboxTemplateNotFoundError, SandboxWarmPoolNotFoundError
@@ -24,27 +24,55 @@ from .constants import (
     CLAIM_API_VERSION,
     CLAIM_PLURAL_NAME,
     TERMINAL_CLAIM_READY_REASONS,
-    CLIENT_REQUEST_TIME_ANNOTATION,
     GATEWAY_API_GROUP,
     GATEWAY_API_VERSION,
     GATEWAY_PLURAL,
     SANDBOX_API_GROUP,
     SANDBOX_API_VERSION,
     SANDBOX_PLURAL_NAME,
-    CREATED_BY_LABEL,
 )
-from .utils import select_pod_ip
+from .utils import build_sandbox_claim_manifest, select_pod_ip
+
+_shared_api_client: client.ApiClient | None = None
+_shared_api_client_lock = threading.Lock()
+
+# Floor for the shared urllib3 pool. The kubernetes client's default of
+# cpu_count() * 5 leaves few-core hosts with a handful of connections, so
+# threads driving many sandboxes would otherwise discard and re-handshake
+# connections under load.
+_MIN_CONNECTION_POOL_MAXSIZE = 32
+
+
+def _get_shared_api_client() -> client.ApiClient:
+    """Returns the process-wide ApiClient, loading the kube config on first use.
+
+    Every K8sHelper (one per SandboxClient) shares this client so they reuse a
+    single urllib3 connection pool to the API server.
+    """
+    global _shared_api_client
+    if _shared_api_client is None:
+        with _shared_api_client_lock:
+            if _shared_api_client is None:
+                try:
+                    config.load_incluster_config()
+                except config.ConfigException:
+                    config.load_kube_config()
+                configuration = client.Configuration.get_default_copy()
+                configuration.connection_pool_maxsize = max(
+                    configuration.connection_pool_maxsize or 0,
+                    _MIN_CONNECTION_POOL_MAXSIZE,
+                )
+                _shared_api_client = client.ApiClient(configuration)
+    return _shared_api_client
+
 
 class K8sHelper:
     """Helper class for Kubernetes API interactions."""
 
     def __init__(self):
-        try:
-            config.load_incluster_config()
-        except config.ConfigException:
-            config.load_kube_config()
-        self.custom_objects_api = client.CustomObjectsApi()
-        self.core_v1_api = client.CoreV1Api()
+        api_client = _get_shared_api_client()
+        self.custom_objects_api = client.CustomObjectsApi(api_client)
+        self.core_v1_api = client.CoreV1Api(api_client)
 
     def create_sandbox_claim(
         self,
@@ -66,37 +94,15 @@ class K8sHelper:
                 annotations propagate onto the running Sandbox Pod (as opposed to
                 ``labels``, which only land on the SandboxClaim object).
         """
-        updated_annotations = dict(annotations) if annotations else {}
-        if CLIENT_REQUEST_TIME_ANNOTATION not in updated_annotations:
-            updated_annotations[CLIENT_REQUEST_TIME_ANNOTATION] = datetime.now(UTC).isoformat()
-
-        metadata = {
-            "name": name,
-            "annotations": updated_annotations,
-            "labels": {
-                **(labels or {}),
-                CREATED_BY_LABEL: "python-client",
-            }
-        }
-
-        spec = {
-            "warmPoolRef": {
-                "name": warmpool
-            }
-        }
-        if lifecycle:
-            spec["lifecycle"] = lifecycle
-        if volume_claim_templates:
-            spec["volumeClaimTemplates"] = volume_claim_templates
-        if pod_metadata:
-            spec["additionalPodMetadata"] = pod_metadata
-
-        manifest = {
-            "apiVersion": f"{CLAIM_API_GROUP}/{CLAIM_API_VERSION}",
-            "kind": "SandboxClaim",
-            "metadata": metadata,
-            "spec": spec,
-        }
+        manifest = build_sandbox_claim_manifest(
+            name,
+            warmpool,
+            annotations=annotations,
+            labels=labels,
+            lifecycle=lifecycle,
+            volume_claim_templates=volume_claim_templates,
+            pod_metadata=pod_metadata,
+        )
         logging.info(f"Creating SandboxClaim '{name}' in namespace '{namespace}' using warm pool '{warmpool}'...")
         return self.custom_objects_api.create_namespaced_custom_object(
             group=CLAIM_API_GROUP,
@@ -164,13 +170,15 @@ class K8sHelper:
         deadline = time.monotonic() + timeout
         rv = resource_version or "0"
         logging.info(f"Watching claim '{claim_name}' for {wait_target} (from resourceVersion={rv})...")
+        # Each Watch builds its own ApiClient; build one per wait and let
+        # stream() (which resets the stop flag) reuse it across restarts.
+        w = watch.Watch()
         while True:
             remaining = int(deadline - time.monotonic())
             if remaining <= 0:
                 raise TimeoutError(
                     f"Could not resolve {wait_target} from claim "
                     f"'{claim_name}' within {timeout} seconds.")
-            w = watch.Watch()
             try:
                 event_iter = w.stream(
                     func=self.custom_objects_api.list_namespaced_custom_object,
@@ -199,33 +207,29 @@ class K8sHelper:
 
                         ready = False
                         for cond in status.get('conditions', []):
-                            if (
-                                cond.get('type') == 'Ready'
-                                and cond.get('status') == 'False'
-                                and cond.get('reason') == 'TemplateNotFound'
-                            ):
+                            cond_type = cond.get('type')
+                            cond_status = cond.get('status')
+                            reason = cond.get('reason')
+                            not_ready = cond_type == 'Ready' and cond_status == 'False'
+                            if not_ready and reason == 'TemplateNotFound':
                                 w.stop()
                                 raise SandboxTemplateNotFoundError(
                                     f"SandboxTemplate requested does not exist: {cond.get('message', 'Template not found')}"
                                 )
-                            elif cond.get('reason') == 'WarmPoolNotFound':
+                            elif reason == 'WarmPoolNotFound':
                                 w.stop()
                                 raise SandboxWarmPoolNotFoundError(
                                     f"SandboxWarmPool requested does not exist: {cond.get('message', 'WarmPool not found')}"
                                 )
-                            elif (
-                                cond.get('type') == 'Ready'
-                                and cond.get('status') == 'False'
-                                and cond.get('reason') in TERMINAL_CLAIM_READY_REASONS
-                            ):
+                            elif not_ready and reason in TERMINAL_CLAIM_READY_REASONS:
                                 # The controller reported a failure it will not
                                 # retry; waiting out the timeout cannot succeed.
                                 w.stop()
                                 raise SandboxClaimFailedError(
                                     f"SandboxClaim '{claim_name}' failed with terminal reason "
-                                    f"{cond.get('reason')}: {cond.get('message', '')}"
+                                    f"{reason}: {cond.get('message', '')}"
                                 )
-                            if cond.get('type') == 'Ready' and cond.get('status') == 'True':
+                            if cond_type == 'Ready' and cond_status == 'True':
                                 ready = True
 
                         sandbox_status = status.get('sandbox', {})
@@ -255,37 +259,52 @@ class K8sHelper:
         no valid IP can be selected.
         """
         deadline = time.monotonic() + timeout
+        rv = None
         logging.info(f"Watching for Sandbox {name} to become ready...")
+        w = watch.Watch()
         while True:
             remaining = int(deadline - time.monotonic())
             if remaining <= 0:
                 raise TimeoutError(f"Sandbox {name} did not become ready within {timeout} seconds.")
-            w = watch.Watch()
-            for event in w.stream(
-                func=self.custom_objects_api.list_namespaced_custom_object,
-                namespace=namespace,
-                group=SANDBOX_API_GROUP,
-                version=SANDBOX_API_VERSION,
-                plural=SANDBOX_PLURAL_NAME,
-                field_selector=f"metadata.name={name}",
-                timeout_seconds=remaining
-            ):
-                if event is None:
-                    continue
-                if event["type"] in ["ADDED", "MODIFIED"]:
-                    sandbox_object = event['object']
-                    status = sandbox_object.get('status') or {}
-                    conditions = status.get('conditions', [])
-                    for cond in conditions:
-                        if cond.get('type') == 'Ready' and cond.get('status') == 'True':
+            try:
+                for event in w.stream(
+                    func=self.custom_objects_api.list_namespaced_custom_object,
+                    namespace=namespace,
+                    group=SANDBOX_API_GROUP,
+                    version=SANDBOX_API_VERSION,
+                    plural=SANDBOX_PLURAL_NAME,
+                    field_selector=f"metadata.name={name}",
+                    resource_version=rv,
+                    timeout_seconds=remaining
+                ):
+                    if event is None:
+                        continue
+                    if event["type"] in ["ADDED", "MODIFIED"]:
+                        sandbox_object = event['object']
+                        # Resume a restarted stream from the last-seen version.
+                        rv = (sandbox_object.get('metadata') or {}).get('resourceVersion') or rv
+                        status = sandbox_object.get('status') or {}
+                        ready_cond = next(
+                            (c for c in status.get('conditions', ()) if c.get('type') == 'Ready'),
+                            None,
+                        )
+                        if ready_cond and ready_cond.get('status') == 'True':
                             logging.info(f"Sandbox {name} is ready.")
                             w.stop()
                             pod_ips = status.get('podIPs', [])
                             return select_pod_ip(pod_ips)
-                elif event["type"] == "DELETED":
-                    logging.error(f"Sandbox {name} was deleted before becoming ready.")
-                    w.stop()
-                    raise SandboxNotFoundError(f"Sandbox {name} was deleted before becoming ready.")
+                    elif event["type"] == "DELETED":
+                        logging.error(f"Sandbox {name} was deleted before becoming ready.")
+                        w.stop()
+                        raise SandboxNotFoundError(f"Sandbox {name} was deleted before becoming ready.")
+            except client.ApiException as e:
+                if e.status == 410:
+                    logging.info(
+                        f"Watch on Sandbox '{name}' expired (410 Gone at resourceVersion={rv}); "
+                        "restarting from current state")
+                    rv = None
+                    continue
+                raise
 
     def delete_sandbox_claim(self, name: str, namespace: str):
         """Deletes a SandboxClaim custom resource."""
@@ -364,9 +383,9 @@ class K8sHelper:
                 kwargs["label_selector"] = label_selector
             response = self.custom_objects_api.list_namespaced_custom_object(**kwargs)
             return [
-                item.get("metadata", {}).get("name") 
-                for item in response.get("items", []) 
-                if item.get("metadata", {}).get("name")
+                name
+                for item in response.get("items", [])
+                if (name := (item.get("metadata") or {}).get("name"))
             ]
         except client.ApiException as e:
             logging.error(f"Error listing sandbox claims in namespace {namespace}: {e}")
@@ -375,41 +394,53 @@ class K8sHelper:
     def wait_for_gateway_ip(self, gateway_name: str, namespace: str, timeout: int) -> str:
         """Waits for the Gateway to be assigned an external IP."""
         deadline = time.monotonic() + timeout
+        rv = None
         logging.info(f"Waiting for Gateway '{gateway_name}' in namespace '{namespace}'...")
+        w = watch.Watch()
         while True:
             remaining = int(deadline - time.monotonic())
             if remaining <= 0:
                 raise TimeoutError(f"Gateway '{gateway_name}' did not get an IP.")
-            w = watch.Watch()
-            for event in w.stream(
-                func=self.custom_objects_api.list_namespaced_custom_object,
-                namespace=namespace,
-                group=GATEWAY_API_GROUP,
-                version=GATEWAY_API_VERSION,
-                plural=GATEWAY_PLURAL,
-                field_selector=f"metadata.name={gateway_name}",
-                timeout_seconds=remaining,
-            ):
-                if event is None:
-                    continue
-                if event["type"] in ["ADDED", "MODIFIED"]:
-                    gateway_object = event['object']
-                    status = gateway_object.get('status') or {}
-                    addresses = status.get('addresses', [])
-                    for address in addresses:
-                        if not isinstance(address, dict):
-                            continue
-                        ip_address = address.get('value')
-                        if not ip_address:
-                            continue
+            try:
+                for event in w.stream(
+                    func=self.custom_objects_api.list_namespaced_custom_object,
+                    namespace=namespace,
+                    group=GATEWAY_API_GROUP,
+                    version=GATEWAY_API_VERSION,
+                    plural=GATEWAY_PLURAL,
+                    field_selector=f"metadata.name={gateway_name}",
+                    resource_version=rv,
+                    timeout_seconds=remaining,
+                ):
+                    if event is None:
+                        continue
+                    if event["type"] in ["ADDED", "MODIFIED"]:
+                        gateway_object = event['object']
+                        rv = (gateway_object.get('metadata') or {}).get('resourceVersion') or rv
+                        status = gateway_object.get('status') or {}
+                        addresses = status.get('addresses', [])
+                        for address in addresses:
+                            if not isinstance(address, dict):
+                                continue
+                            ip_address = address.get('value')
+                            if not ip_address:
+                                continue
                         
-                        if not is_valid_ip(ip_address) and not is_valid_gateway_hostname(ip_address):
-                            logging.warning(
-                                "Gateway address rejected because %r is neither a valid IP address nor a valid gateway hostname.",
-                                ip_address,
-                            )
-                            continue
+                            if not is_valid_ip(ip_address) and not is_valid_gateway_hostname(ip_address):
+                                logging.warning(
+                                    "Gateway address rejected because %r is neither a valid IP address nor a valid gateway hostname.",
+                                    ip_address,
+                                )
+                                continue
                         
-                        logging.info(f"Gateway ready. IP: {ip_address}")
-                        w.stop()
-                        return ip_address
+                            logging.info(f"Gateway ready. IP: {ip_address}")
+                            w.stop()
+                            return ip_address
+            except client.ApiException as e:
+                if e.status == 410:
+                    logging.info(
+                        f"Watch on Gateway '{gateway_name}' expired (410 Gone at resourceVersion={rv}); "
+                        "restarting from current state")
+                    rv = None
+                    continue
+                raise
@@ -14,10 +14,12 @@
 
 import re
 from typing import Literal, Union
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 class ExecutionResult(BaseModel):
     """A structured object for holding the result of a command execution."""
+    model_config = ConfigDict(frozen=True)
+
     stdout: str = ""  # Standard output from the command.
     stderr: str = ""  # Standard error from the command.
     exit_code: int = -1  # Exit code of the command.
@@ -15,6 +15,7 @@
 import atexit
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from .trace_manager import create_tracer_manager, trace_span, trace
 from .commands.command_executor import CommandExecutor
 from .files.filesystem import Filesystem
@@ -46,6 +47,7 @@ class Sandbox:
         connection_config: SandboxConnectionConfig | None = None,
         tracer_config: SandboxTracerConfig | None = None,
         k8s_helper: K8sHelper | None = None,
+        http_adapter: HTTPAdapter | None = None,
     ):
         # Sandbox Related Configuration
         self.claim_name = claim_name
@@ -62,6 +64,7 @@ class Sandbox:
             connection_config=self.connection_config,
             k8s_helper=self.k8s_helper,
             get_pod_ip=self.get_pod_ip,
+            http_adapter=http_adapter,
         )
 
         # Tracer initialization
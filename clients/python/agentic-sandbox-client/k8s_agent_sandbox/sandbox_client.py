@@ -17,17 +17,25 @@ It handles lifecycle management (claiming, waiting) and interaction (execution,
 file I/O) via the Sandbox resource handle.
 """
 
-import uuid
 import atexit
 import sys
 import logging
 from typing import List, Dict, Tuple, TypeVar, Generic, Type
 
+from requests.adapters import HTTPAdapter
+
 # Import all tracing components from the trace_manager module
 from .trace_manager import (
     create_tracer_manager, initialize_tracer, trace_span, trace
 )
 from .sandbox import Sandbox
+from .connector import (
+    HTTP_BACKOFF_FACTOR,
+    HTTP_RETRIES,
+    HTTP_RETRY_STATUSES,
+    build_http_adapter,
+    build_retry,
+)
 from .models import (
     SandboxConnectionConfig,
     SandboxLocalTunnelConnectionConfig,
@@ -35,7 +43,7 @@ from .models import (
 )
 from .k8s_helper import K8sHelper
 from .pod_metadata import build_pod_metadata, validate_labels
-from .utils import construct_sandbox_claim_lifecycle_spec
+from .utils import construct_sandbox_claim_lifecycle_spec, generate_claim_name
 from .exceptions import SandboxNotFoundError
 
 logging.basicConfig(level=logging.INFO,
@@ -57,6 +65,10 @@ class SandboxClient(Generic[T]):
         connection_config: SandboxConnectionConfig | None = None,
         tracer_config: SandboxTracerConfig | None = None,
         cleanup: bool = False,
+        http_adapter: HTTPAdapter | None = None,
+        http_retries: int = HTTP_RETRIES,
+        http_backoff_factor: float = HTTP_BACKOFF_FACTOR,
+        http_retry_statuses: tuple[int, ...] = HTTP_RETRY_STATUSES,
     ):
         """
         Initializes the SandboxClient.
@@ -70,9 +82,35 @@ class SandboxClient(Generic[T]):
                 Defaults to an empty SandboxTracerConfig (tracing disabled).
             cleanup: If True, registers an atexit hook to automatically delete 
                 all tracked sandboxes when the program terminates. Defaults to False.
+            http_adapter: Optional ``requests`` adapter mounted by every sandbox
+                this client opens, e.g. to tune pool sizes or retries. Defaults
+                to a process-wide adapter with a small retry policy. The
+                adapter is shared, so the caller remains responsible for
+                closing it.
+            http_retries: Maximum retries for a sandbox HTTP request that
+                fails to connect or returns one of ``http_retry_statuses``.
+            http_backoff_factor: Base of the exponential backoff between
+                retries; each wait is capped at 2 seconds, as is any
+                server-sent ``Retry-After``.
+            http_retry_statuses: Response status codes that are retried.
+                The ``http_*`` retry settings cannot be combined with
+                ``http_adapter``, which carries its own retry policy.
         """
+        retry_settings = (http_retries, http_backoff_factor, tuple(http_retry_statuses))
+        if retry_settings != (HTTP_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_RETRY_STATUSES):
+            if http_adapter is not None:
+                raise ValueError(
+                    "http_retries, http_backoff_factor and http_retry_statuses "
+                    "cannot be combined with http_adapter; configure the "
+                    "adapter's max_retries instead."
+                )
+            http_adapter = build_http_adapter(
+                build_retry(http_retries, http_backoff_factor, http_retry_statuses)
+            )
+
         # Sandbox related configuration
         self.connection_config = connection_config or SandboxLocalTunnelConnectionConfig()
+        self.http_adapter = http_adapter
         
         # Tracer configuration
         self.tracer_config = tracer_config or SandboxTracerConfig()
@@ -141,7 +179,7 @@ class SandboxClient(Generic[T]):
 
         lifecycle = construct_sandbox_claim_lifecycle_spec(shutdown_after_seconds) if shutdown_after_seconds is not None else None
 
-        claim_name = f"sandbox-claim-{uuid.uuid4().hex[:8]}"
+        claim_name = generate_claim_name()
 
         try:
             created_claim = self._create_claim(
@@ -174,6 +212,7 @@ class SandboxClient(Generic[T]):
                 connection_config=self.connection_config,
                 tracer_config=self.tracer_config,
                 k8s_helper=self.k8s_helper,
+                http_adapter=self.http_adapter,
             )
         except Exception:
             # If creation or waiting fails, ensure we don't leave an orphaned claim
@@ -236,7 +275,8 @@ class SandboxClient(Generic[T]):
             namespace=namespace,
             connection_config=self.connection_config,
             tracer_config=self.tracer_config,
-            k8s_helper=self.k8s_helper
+            k8s_helper=self.k8s_helper,
+            http_adapter=self.http_adapter,
         )
 
         self._active_connection_sandboxes[key] = new_handle
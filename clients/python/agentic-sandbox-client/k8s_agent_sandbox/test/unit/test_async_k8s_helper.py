@@ -26,6 +26,24 @@ from k8s_agent_sandbox.exceptions import SandboxMetadataError, SandboxTemplateNo
 from k8s_agent_sandbox.constants import CLIENT_REQUEST_TIME_ANNOTATION
 
 
+@patch("k8s_agent_sandbox.async_k8s_helper._kube_config_loaded", False)
+@patch("k8s_agent_sandbox.async_k8s_helper.client.ApiClient")
+@patch("k8s_agent_sandbox.async_k8s_helper.config")
+class TestAsyncK8sHelperConfigLoad(unittest.IsolatedAsyncioTestCase):
+
+    async def test_kube_config_loaded_once_across_helpers(self, mock_config, mock_api_client_cls):
+        mock_config.ConfigException = Exception
+        mock_config.load_incluster_config.side_effect = Exception("not in cluster")
+        mock_config.load_kube_config = AsyncMock()
+
+        for helper in (AsyncK8sHelper(), AsyncK8sHelper()):
+            await helper._ensure_initialized()
+
+        mock_config.load_incluster_config.assert_called_once()
+        mock_config.load_kube_config.assert_awaited_once()
+        self.assertEqual(mock_api_client_cls.call_count, 2)
+
+
 class TestAsyncK8sHelperCreateSandboxClaim(unittest.IsolatedAsyncioTestCase):
 
     async def asyncSetUp(self):
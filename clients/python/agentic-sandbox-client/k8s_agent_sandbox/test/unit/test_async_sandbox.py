@@ -14,6 +14,7 @@
 
 """Unit tests for the async Sandbox connection lifecycle."""
 
+import asyncio
 import unittest
 
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -162,6 +163,7 @@ class TestAsyncSandbox(unittest.IsolatedAsyncioTestCase):
             connection_config=mock_connection_config,
             k8s_helper=mock_k8s_helper_instance,
             get_pod_ip=sandbox.get_pod_ip,
+            transport=None,
         )
 
         mock_create_tracer_manager.assert_called_once_with(mock_tracer_config)
@@ -414,6 +416,24 @@ class TestAsyncSandboxTerminateIdempotent(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(helper.delete_sandbox_claim.await_count, 2)
         self.assertIsNone(sandbox.claim_name)
 
+    async def test_terminate_deletes_claim_while_connection_closes(self):
+        sandbox, helper = self._build_sandbox()
+        delete_started = asyncio.Event()
+
+        async def slow_close():
+            await asyncio.wait_for(delete_started.wait(), timeout=1)
+
+        async def delete(*args):
+            delete_started.set()
+
+        sandbox.connector.close = slow_close
+        helper.delete_sandbox_claim.side_effect = delete
+
+        await sandbox.terminate()
+
+        self.assertFalse(sandbox.is_active)
+        self.assertIsNone(sandbox.claim_name)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+import io
 import json
 import unittest
 from http import HTTPStatus
@@ -25,10 +26,11 @@ import pytest
 httpx = pytest.importorskip("httpx")
 pytest.importorskip("kubernetes_asyncio")
 
-from k8s_agent_sandbox.async_connector import AsyncSandboxConnector
+from k8s_agent_sandbox.async_connector import AsyncSandboxConnector, SharedTransport
 from k8s_agent_sandbox.async_sandbox import AsyncSandbox
 from k8s_agent_sandbox.async_sandbox_client import AsyncSandboxClient
 from k8s_agent_sandbox.exceptions import SandboxRequestError
+from k8s_agent_sandbox.files.async_filesystem import AsyncFilesystem
 from k8s_agent_sandbox.models import (
     SandboxDirectConnectionConfig,
     SandboxGatewayConnectionConfig,
@@ -497,6 +499,38 @@ class TestAsyncSandboxClientInCluster(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(call_kwargs["connection_config"], config)
 
 
+class TestAsyncSandboxClientTransport(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        patcher = patch("k8s_agent_sandbox.async_sandbox_client.AsyncK8sHelper")
+        self.MockAsyncK8sHelper = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_transport_reaches_every_sandbox_and_outlives_client(self):
+        seen = []
+        transport = httpx.MockTransport(
+            lambda request: seen.append(request.url.path) or httpx.Response(200, json={})
+        )
+        transport.aclose = AsyncMock()
+        client = AsyncSandboxClient(
+            connection_config=SandboxDirectConnectionConfig(api_url="http://sandbox.example"),
+            transport=transport,
+            cleanup=False,
+        )
+        client.k8s_helper.resolve_sandbox_name = AsyncMock(side_effect=lambda name, *a, **kw: name)
+        client.k8s_helper.get_sandbox = AsyncMock(return_value={"metadata": {}})
+        client.k8s_helper.close = AsyncMock()
+
+        first = await client.get_sandbox("claim-a")
+        second = await client.get_sandbox("claim-b")
+        await first.connector.send_request("GET", "execute")
+        await second.connector.send_request("GET", "execute")
+        await client.close()
+
+        self.assertEqual(seen, ["/execute", "/execute"])
+        transport.aclose.assert_not_awaited()
+
+
 class TestAsyncConnector(unittest.IsolatedAsyncioTestCase):
 
     async def test_rejects_local_tunnel_config(self):
@@ -579,6 +613,167 @@ class TestAsyncConnector(unittest.IsolatedAsyncioTestCase):
         url = await connector._resolve_base_url()
         self.assertEqual(url, "http://34.56.78.90")
 
+    async def test_custom_transport_is_used(self):
+        seen = []
+
+        def handler(request):
+            seen.append(str(request.url))
+            return httpx.Response(200, json={"ok": True})
+
+        connector = AsyncSandboxConnector(
+            sandbox_id="my-sandbox",
+            namespace="dev",
+            connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+            k8s_helper=MagicMock(),
+            transport=httpx.MockTransport(handler),
+        )
+        response = await connector.send_request("GET", "execute")
+        await connector.close()
+
+        self.assertEqual(response.json(), {"ok": True})
+        self.assertEqual(seen, ["http://router/execute"])
+
+    async def test_async_read_streams_into_file_object(self):
+        connector = AsyncSandboxConnector(
+            sandbox_id="my-sandbox",
+            namespace="dev",
+            connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+            k8s_helper=MagicMock(),
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"abcdef")),
+        )
+        files = AsyncFilesystem(connector, None, "sandbox-client")
+        out = io.BytesIO()
+
+        result = await files.read("data.bin", out=out, chunk_size=4)
+        await connector.close()
+
+        self.assertIsNone(result)
+        self.assertEqual(out.getvalue(), b"abcdef")
+
+    async def test_stream_request_error_body_is_readable(self):
+        connector = AsyncSandboxConnector(
+            sandbox_id="my-sandbox",
+            namespace="dev",
+            connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+            k8s_helper=MagicMock(),
+            transport=httpx.MockTransport(lambda request: httpx.Response(404, json={"detail": "missing"})),
+        )
+        with self.assertRaises(SandboxRequestError) as ctx:
+            await connector.send_request("GET", "download/x", stream=True)
+        await connector.close()
+
+        self.assertEqual(ctx.exception.response.json(), {"detail": "missing"})
+
+    async def test_shared_transport_survives_connector_close(self):
+        inner = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+        inner.aclose = AsyncMock()
+        shared = SharedTransport(inner)
+
+        def make_connector():
+            return AsyncSandboxConnector(
+                sandbox_id="my-sandbox",
+                namespace="dev",
+                connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+                k8s_helper=MagicMock(),
+                transport=shared,
+            )
+
+        first = make_connector()
+        await first.send_request("GET", "execute")
+        await first.close()
+        inner.aclose.assert_not_awaited()
+
+        second = make_connector()
+        response = await second.send_request("GET", "execute")
+        await second.close()
+        self.assertEqual(response.json(), {"ok": True})
+
+        await shared.close()
+        inner.aclose.assert_awaited_once()
+
+    async def test_500_is_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"detail": "boom"})
+
+        connector = AsyncSandboxConnector(
+            sandbox_id="my-sandbox",
+            namespace="dev",
+            connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+            k8s_helper=MagicMock(),
+            transport=httpx.MockTransport(handler),
+        )
+        with self.assertRaises(SandboxRequestError) as ctx:
+            await connector.send_request("GET", "execute")
+        await connector.close()
+
+        self.assertEqual(ctx.exception.status_code, 500)
+        self.assertEqual(len(calls), 1)
+
+    @patch("k8s_agent_sandbox.async_connector.asyncio.sleep", new_callable=AsyncMock)
+    async def test_503_honors_retry_after(self, mock_sleep):
+        responses = iter([
+            httpx.Response(503, headers={"Retry-After": "1.5"}),
+            httpx.Response(200, json={"ok": True}),
+        ])
+        connector = AsyncSandboxConnector(
+            sandbox_id="my-sandbox",
+            namespace="dev",
+            connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+            k8s_helper=MagicMock(),
+            transport=httpx.MockTransport(lambda request: next(responses)),
+        )
+        response = await connector.send_request("GET", "execute")
+        await connector.close()
+
+        self.assertEqual(response.status_code, 200)
+        mock_sleep.assert_awaited_once_with(1.5)
+
+    @patch("k8s_agent_sandbox.async_connector.asyncio.sleep", new_callable=AsyncMock)
+    async def test_503_retry_after_is_capped(self, mock_sleep):
+        for retry_after in ("3600", "inf", "nan", "-inf"):
+            with self.subTest(retry_after=retry_after):
+                mock_sleep.reset_mock()
+                responses = iter([
+                    httpx.Response(503, headers={"Retry-After": retry_after}),
+                    httpx.Response(200),
+                ])
+                connector = AsyncSandboxConnector(
+                    sandbox_id="my-sandbox",
+                    namespace="dev",
+                    connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+                    k8s_helper=MagicMock(),
+                    transport=httpx.MockTransport(lambda request: next(responses)),
+                )
+                await connector.send_request("GET", "execute")
+                await connector.close()
+
+                (delay,), _ = mock_sleep.await_args
+                self.assertGreaterEqual(delay, 0.0)
+                self.assertLessEqual(delay, 2.0)
+
+    @patch("k8s_agent_sandbox.async_connector.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retry_delays_are_jittered_within_bounds(self, mock_sleep):
+        responses = iter([httpx.Response(502)] * 3 + [httpx.Response(200)])
+        connector = AsyncSandboxConnector(
+            sandbox_id="my-sandbox",
+            namespace="dev",
+            connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+            k8s_helper=MagicMock(),
+            transport=httpx.MockTransport(lambda request: next(responses)),
+        )
+        with patch("k8s_agent_sandbox.async_connector.random.uniform", side_effect=lambda a, b: b) as uniform:
+            await connector.send_request("GET", "execute")
+        await connector.close()
+
+        self.assertEqual(
+            [c.args for c in uniform.call_args_list],
+            [(0.3, 0.3 * 3), (0.3, 2.0), (0.3, 2.0)],
+        )
+        self.assertEqual(mock_sleep.await_count, 3)
+
     async def test_in_cluster_does_not_inject_router_headers(self):
         config = SandboxInClusterConnectionConfig(server_port=8888)
         connector = AsyncSandboxConnector(
@@ -926,6 +1121,7 @@ class TestAsyncSandboxClientInClusterConnectionConfig(unittest.IsolatedAsyncioTe
 
         call_kwargs = self.mock_sandbox_class.call_args.kwargs
         self.assertEqual(call_kwargs["connection_config"], self.config)
+        self.assertIs(call_kwargs["transport"], self.client._transport)
 
     async def test_get_sandbox_passes_connection_config(self):
         self.mock_k8s_helper.resolve_sandbox_name = AsyncMock(return_value="sandbox-123")
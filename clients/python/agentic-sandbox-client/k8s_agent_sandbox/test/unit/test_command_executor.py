@@ -13,10 +13,13 @@
 # limitations under the License.
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pydantic import ValidationError
 
 from k8s_agent_sandbox.commands.command_executor import CommandExecutor, _extract_executable
 from k8s_agent_sandbox.commands.async_command_executor import AsyncCommandExecutor
+from k8s_agent_sandbox.exceptions import SandboxRequestError
 from k8s_agent_sandbox.models import ExecutionResult
 
 
@@ -42,11 +45,7 @@ class TestCommandExecutor(unittest.TestCase):
 
         mock_connector = MagicMock()
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "stdout": "hello",
-            "stderr": "",
-            "exit_code": 0
-        }
+        mock_response.content = b'{"stdout": "hello", "stderr": "", "exit_code": 0}'
         mock_connector.send_request.return_value = mock_response
 
         executor = CommandExecutor(mock_connector, MagicMock(), "sandbox-client")
@@ -56,6 +55,74 @@ class TestCommandExecutor(unittest.TestCase):
         mock_span.set_attribute.assert_any_call("sandbox.exit_code", 0)
         self.assertEqual(result.stdout, "hello")
 
+    def test_sync_executor_rejects_malformed_json(self):
+        mock_connector = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = b"<html>bad gateway</html>"
+        mock_response.text = "<html>bad gateway</html>"
+        mock_connector.send_request.return_value = mock_response
+
+        executor = CommandExecutor(mock_connector, MagicMock(), "sandbox-client")
+        with self.assertRaisesRegex(RuntimeError, "Failed to decode JSON"):
+            executor.run("echo hi")
+
+    def test_sync_run_many_posts_one_batch(self):
+        mock_connector = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = (
+            b'[{"stdout": "a", "stderr": "", "exit_code": 0},'
+            b' {"stdout": "", "stderr": "boom", "exit_code": 2}]'
+        )
+        mock_connector.send_request.return_value = mock_response
+
+        executor = CommandExecutor(mock_connector, MagicMock(), "sandbox-client")
+        results = executor.run_many(["echo a", "false", "echo c"])
+
+        mock_connector.send_request.assert_called_once_with(
+            "POST", "execute_batch",
+            json={"commands": ["echo a", "false", "echo c"], "stop_on_error": True},
+            timeout=60,
+        )
+        self.assertEqual([r.exit_code for r in results], [0, 2])
+        self.assertEqual(results[1].stderr, "boom")
+
+    def test_sync_run_many_falls_back_when_batch_unsupported(self):
+        def send_request(method, endpoint, json, timeout):
+            if endpoint == "execute_batch":
+                raise SandboxRequestError("not found", status_code=404)
+            response = MagicMock()
+            exit_code = 1 if json["command"] == "false" else 0
+            response.content = b'{"stdout": "", "stderr": "", "exit_code": %d}' % exit_code
+            return response
+
+        mock_connector = MagicMock()
+        mock_connector.send_request.side_effect = send_request
+        executor = CommandExecutor(mock_connector, MagicMock(), "sandbox-client")
+
+        results = executor.run_many(["echo a", "false", "echo c"])
+        self.assertEqual([r.exit_code for r in results], [0, 1])
+
+        # The unsupported batch endpoint is not retried on later calls.
+        executor.run_many(["echo d"])
+        endpoints = [c.args[1] for c in mock_connector.send_request.call_args_list]
+        self.assertEqual(endpoints, ["execute_batch", "execute", "execute", "execute"])
+
+    def test_sync_run_many_propagates_other_errors(self):
+        mock_connector = MagicMock()
+        mock_connector.send_request.side_effect = SandboxRequestError("boom", status_code=500)
+        executor = CommandExecutor(mock_connector, MagicMock(), "sandbox-client")
+
+        with self.assertRaises(SandboxRequestError):
+            executor.run_many(["echo a"])
+        mock_connector.send_request.assert_called_once()
+
+    def test_execution_result_is_frozen_and_hashable(self):
+        result = ExecutionResult(stdout="out", stderr="", exit_code=0)
+        with self.assertRaises(ValidationError):
+            result.exit_code = 1
+        self.assertEqual(hash(result), hash(ExecutionResult(stdout="out", stderr="", exit_code=0)))
+
+
 
 class TestAsyncCommandExecutor(unittest.IsolatedAsyncioTestCase):
 
@@ -67,11 +134,7 @@ class TestAsyncCommandExecutor(unittest.IsolatedAsyncioTestCase):
 
         mock_connector = MagicMock()
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "stdout": "hello_async",
-            "stderr": "",
-            "exit_code": 0
-        }
+        mock_response.content = b'{"stdout": "hello_async", "stderr": "", "exit_code": 0}'
         
         async def async_send(*args, **kwargs):
             return mock_response
@@ -85,5 +148,38 @@ class TestAsyncCommandExecutor(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.stdout, "hello_async")
 
 
+    async def test_async_run_many_posts_one_batch(self):
+        mock_connector = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = b'[{"stdout": "x", "stderr": "", "exit_code": 0}]'
+        mock_connector.send_request = AsyncMock(return_value=mock_response)
+
+        executor = AsyncCommandExecutor(mock_connector, MagicMock(), "sandbox-client")
+        results = await executor.run_many(["echo x"], stop_on_error=False)
+
+        mock_connector.send_request.assert_awaited_once_with(
+            "POST", "execute_batch",
+            json={"commands": ["echo x"], "stop_on_error": False},
+            timeout=60,
+        )
+        self.assertEqual(results[0].stdout, "x")
+
+    async def test_async_run_many_falls_back_when_batch_unsupported(self):
+        ok = MagicMock()
+        ok.content = b'{"stdout": "x", "stderr": "", "exit_code": 0}'
+        mock_connector = MagicMock()
+        mock_connector.send_request = AsyncMock(
+            side_effect=[SandboxRequestError("not allowed", status_code=405), ok, ok]
+        )
+
+        executor = AsyncCommandExecutor(mock_connector, MagicMock(), "sandbox-client")
+        results = await executor.run_many(["echo x", "echo y"], timeout=5)
+
+        self.assertEqual([r.stdout for r in results], ["x", "x"])
+        mock_connector.send_request.assert_awaited_with(
+            "POST", "execute", json={"command": "echo y"}, timeout=5
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
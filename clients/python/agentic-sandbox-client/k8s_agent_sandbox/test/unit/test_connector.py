@@ -12,18 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import subprocess
+import sys
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from k8s_agent_sandbox.connector import (
+    DEFAULT_RETRY,
     DirectConnectionStrategy,
     GatewayConnectionStrategy,
     LocalTunnelConnectionStrategy,
     InClusterConnectionStrategy,
     SandboxConnector,
+    _wait_for_exit,
 )
+from k8s_agent_sandbox.exceptions import SandboxPortForwardError
 from k8s_agent_sandbox.models import (
     SandboxDirectConnectionConfig,
     SandboxGatewayConnectionConfig,
@@ -123,6 +131,68 @@ class TestGatewayConnectionStrategy(unittest.TestCase):
         self.assertEqual(strategy.connect(), "http://34.56.78.90")
 
 
+class TestLocalTunnelReadiness(unittest.TestCase):
+    def _strategy_with_stdout(self, data: bytes, close_writer: bool):
+        strategy = LocalTunnelConnectionStrategy(
+            "sb", "ns", SandboxLocalTunnelConnectionConfig(port_forward_ready_timeout=5)
+        )
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, data)
+        if close_writer:
+            os.close(write_fd)
+        else:
+            self.addCleanup(os.close, write_fd)
+        process = MagicMock()
+        process.stdout = os.fdopen(read_fd, "rb")
+        self.addCleanup(process.stdout.close)
+        strategy.port_forward_process = process
+        return strategy, process
+
+    def test_forwarding_line_marks_tunnel_ready(self):
+        strategy, process = self._strategy_with_stdout(
+            b"Forwarding from 127.0.0.1:5000 -> 8080\n", close_writer=False
+        )
+        process.poll.return_value = None
+        with patch.object(strategy, "_is_port_open", return_value=True) as probe:
+            self.assertTrue(strategy._wait_for_forwarding(5000, time.monotonic() + 5))
+        probe.assert_called_once_with(5000)
+
+    def test_stdout_eof_reports_tunnel_crash(self):
+        strategy, process = self._strategy_with_stdout(b"", close_writer=True)
+        process.poll.return_value = 1
+        process.communicate.return_value = (b"", b"error: service not found")
+        with self.assertRaisesRegex(SandboxPortForwardError, "service not found"):
+            strategy._wait_for_forwarding(5000, time.monotonic() + 5)
+
+    def test_unselectable_pipe_falls_back_to_probing(self):
+        # Windows: the pipe registers, but select() only accepts sockets.
+        strategy, process = self._strategy_with_stdout(b"", close_writer=False)
+        process.poll.return_value = None
+        with patch(
+            "k8s_agent_sandbox.connector.selectors.DefaultSelector.select",
+            side_effect=OSError(10038, "An operation was attempted on something that is not a socket"),
+        ), patch.object(strategy, "_is_port_open", side_effect=[False, True]) as probe, \
+                patch("k8s_agent_sandbox.connector.time.sleep"):
+            self.assertTrue(strategy._wait_for_forwarding(5000, time.monotonic() + 5))
+        self.assertEqual(probe.call_count, 2)
+
+
+class TestWaitForExit(unittest.TestCase):
+    def test_terminated_process_is_reaped(self):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        process.terminate()
+        self.assertTrue(_wait_for_exit(process, timeout=5))
+        self.assertIsNotNone(process.returncode)
+
+    def test_running_process_times_out(self):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        start = time.monotonic()
+        self.assertFalse(_wait_for_exit(process, timeout=0.2))
+        self.assertLess(time.monotonic() - start, 2)
+
+
 class TestExistingStrategiesDefaultHeaderInjection(unittest.TestCase):
     """Regression: existing strategies must still inject router headers by default."""
 
@@ -164,6 +234,42 @@ class TestSandboxConnectorStrategySelection(unittest.TestCase):
         connector = self._make_connector(config)
         self.assertIsInstance(connector.strategy, DirectConnectionStrategy)
 
+    def test_session_shares_one_retrying_adapter(self):
+        connector = self._make_connector(SandboxDirectConnectionConfig(api_url="http://x"))
+        http_adapter = connector.session.get_adapter("http://x")
+        https_adapter = connector.session.get_adapter("https://x")
+        self.assertIs(http_adapter, https_adapter)
+        self.assertIs(http_adapter.max_retries, DEFAULT_RETRY)
+
+    def test_default_retry_waits_are_capped(self):
+        retry = DEFAULT_RETRY.new(total=10)
+        for _ in range(8):
+            retry = retry.increment(method="GET", url="/", error=ConnectionError())
+        self.assertLessEqual(retry.get_backoff_time(), 2.0)
+        self.assertEqual(retry.parse_retry_after("3600"), 2.0)
+
+    def test_connectors_share_adapter_across_close(self):
+        first = self._make_connector(SandboxDirectConnectionConfig(api_url="http://x"))
+        second = self._make_connector(SandboxDirectConnectionConfig(api_url="http://x"))
+        shared = first.session.get_adapter("http://x")
+        self.assertIs(second.session.get_adapter("http://x"), shared)
+
+        with patch.object(shared, "close") as close:
+            first.close()
+        close.assert_not_called()
+
+    def test_custom_http_adapter_replaces_default(self):
+        adapter = HTTPAdapter(pool_maxsize=4)
+        connector = SandboxConnector(
+            sandbox_id="sb",
+            namespace="ns",
+            connection_config=SandboxDirectConnectionConfig(api_url="http://x"),
+            k8s_helper=MagicMock(),
+            http_adapter=adapter,
+        )
+        self.assertIs(connector.session.get_adapter("http://x"), adapter)
+        self.assertIs(connector.session.get_adapter("https://x"), adapter)
+
     def test_raises_on_unknown_config_type(self):
         with self.assertRaises(ValueError):
             SandboxConnector(
@@ -222,6 +328,34 @@ class TestSandboxConnectorHeaderInjection(unittest.TestCase):
         self.assertIn("X-Sandbox-Namespace", sent_headers)
         self.assertIn("X-Sandbox-Port", sent_headers)
 
+    def test_router_headers_do_not_mutate_caller_headers(self):
+        config = SandboxDirectConnectionConfig(api_url="http://router", server_port=8888)
+        strategy = DirectConnectionStrategy(config)
+        connector, mock_session = self._make_connector_with_strategy(strategy, config)
+        mock_session.request.return_value = self._mock_ok_response()
+        caller_headers = {"X-Custom": "1"}
+
+        connector.send_request("GET", "execute", headers=caller_headers)
+
+        self.assertEqual(caller_headers, {"X-Custom": "1"})
+        sent_headers = mock_session.request.call_args.kwargs["headers"]
+        self.assertEqual(sent_headers["X-Custom"], "1")
+        self.assertEqual(sent_headers["X-Sandbox-ID"], "my-sb")
+        self.assertEqual(sent_headers["X-Sandbox-Port"], "8888")
+
+    def test_headers_none_is_accepted(self):
+        config = SandboxDirectConnectionConfig(api_url="http://router")
+        strategy = DirectConnectionStrategy(config)
+        connector, mock_session = self._make_connector_with_strategy(strategy, config)
+        mock_session.request.return_value = self._mock_ok_response()
+
+        connector.send_request("GET", "execute", headers=None)
+
+        sent_headers = mock_session.request.call_args.kwargs["headers"]
+        self.assertEqual(sent_headers["X-Sandbox-ID"], "my-sb")
+        with self.assertRaises(TypeError):
+            connector._router_headers["X-Sandbox-ID"] = "other"
+
     def test_timeout_header_is_sent_for_router_requests(self):
         config = SandboxDirectConnectionConfig(api_url="http://router")
         strategy = DirectConnectionStrategy(config)
@@ -294,6 +428,18 @@ class TestSandboxConnectorHeaderInjection(unittest.TestCase):
         url = call_args[1]
         self.assertEqual(url, "http://my-sb.my-ns.svc.cluster.local:8888/execute")
 
+    def test_url_joins_base_and_endpoint_slashes(self):
+        config = SandboxDirectConnectionConfig(api_url="http://router/")
+        strategy = DirectConnectionStrategy(config)
+        connector, mock_session = self._make_connector_with_strategy(strategy, config)
+        mock_session.request.return_value = self._mock_ok_response()
+
+        connector.send_request("POST", "/execute")
+        connector.send_request("GET", "download/a.txt")
+
+        urls = [c.args[1] for c in mock_session.request.call_args_list]
+        self.assertEqual(urls, ["http://router/execute", "http://router/download/a.txt"])
+
     def test_allow_redirects_is_false(self):
         config = SandboxDirectConnectionConfig(api_url="http://router")
         strategy = DirectConnectionStrategy(config)
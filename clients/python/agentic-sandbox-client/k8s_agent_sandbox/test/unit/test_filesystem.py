@@ -14,12 +14,21 @@
 
 
 import asyncio
+import io
+import os
+import pathlib
+import tempfile
 import unittest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 import urllib.parse
 
+import httpx
+import requests
+
+from k8s_agent_sandbox.async_connector import AsyncSandboxConnector
 from k8s_agent_sandbox.files.async_filesystem import AsyncFilesystem
 from k8s_agent_sandbox.files.filesystem import Filesystem
+from k8s_agent_sandbox.models import SandboxDirectConnectionConfig
 
 
 class TestFilesystemSafeUploadPath(unittest.TestCase):
@@ -139,6 +148,197 @@ class TestFilesystemSafePaths(unittest.TestCase):
         assert self._get_path_from_last_connector_download_request() == "/dir/foo.txt"
 
 
+class TestFilesystemWriteFileObject(unittest.TestCase):
+    def test_file_object_is_passed_to_upload(self):
+        connector = MagicMock()
+        fs = Filesystem(connector, MagicMock(), trace_service_name="test")
+        fileobj = io.BytesIO(b"payload")
+
+        fs.write("data.bin", fileobj)
+
+        files = connector.send_request.call_args.kwargs["files"]
+        self.assertEqual(files["file"], ("data.bin", fileobj))
+
+    def test_path_is_opened_and_closed_after_upload(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            local = pathlib.Path(tmp, "data.bin")
+            local.write_bytes(b"payload")
+            connector = MagicMock()
+            sent = []
+            connector.send_request.side_effect = lambda *a, **kw: sent.append(
+                (kw["files"]["file"][0], kw["files"]["file"][1].read())
+            )
+            fs = Filesystem(connector, MagicMock(), trace_service_name="test")
+
+            fs.write("data.bin", local)
+
+            self.assertEqual(sent, [("data.bin", b"payload")])
+            self.assertTrue(connector.send_request.call_args.kwargs["files"]["file"][1].closed)
+
+    def test_partially_read_file_is_uploaded_from_start(self):
+        bodies = []
+        connector = MagicMock()
+        # Encode with requests itself, as SandboxConnector would.
+        connector.send_request.side_effect = lambda *a, **kw: bodies.append(
+            requests.Request("POST", "http://sandbox", files=kw["files"]).prepare().body
+        )
+        fs = Filesystem(connector, MagicMock(), trace_service_name="test")
+        fileobj = io.BytesIO(b"header|payload")
+        fileobj.read(7)
+
+        fs.write("data.bin", fileobj)
+
+        self.assertIn(b"\r\n\r\nheader|payload\r\n", bodies[0])
+
+    def test_non_seekable_stream_is_rejected(self):
+        connector = MagicMock()
+        fs = Filesystem(connector, MagicMock(), trace_service_name="test")
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+            with self.assertRaisesRegex(ValueError, "seekable"):
+                fs.write("data.bin", pipe)
+        connector.send_request.assert_not_called()
+
+    def test_async_file_object_is_passed_to_upload(self):
+        connector = AsyncMock()
+        fs = AsyncFilesystem(connector, MagicMock(), trace_service_name="test")
+        fileobj = io.BytesIO(b"payload")
+
+        asyncio.run(fs.write("data.bin", fileobj))
+
+        files = connector.send_request.call_args.kwargs["files"]
+        self.assertEqual(files["file"], ("data.bin", fileobj))
+
+    def test_async_upload_reads_file_in_chunks(self):
+        reads = []
+
+        class RecordingFile(io.BytesIO):
+            def read(self, size=-1):
+                reads.append(size)
+                return super().read(size)
+
+        received = []
+
+        async def handler(request):
+            received.append(len(await request.aread()))
+            return httpx.Response(200)
+
+        async def upload():
+            connector = AsyncSandboxConnector(
+                sandbox_id="my-sandbox",
+                namespace="dev",
+                connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+                k8s_helper=MagicMock(),
+                transport=httpx.MockTransport(handler),
+            )
+            fs = AsyncFilesystem(connector, MagicMock(), trace_service_name="test")
+            try:
+                await fs.write("data.bin", RecordingFile(b"x" * (1 << 20)))
+            finally:
+                await connector.close()
+
+        asyncio.run(upload())
+
+        self.assertGreater(received[0], 1 << 20)
+        self.assertTrue(reads)
+        self.assertTrue(all(0 < size < 1 << 20 for size in reads))
+
+    @staticmethod
+    def _async_upload_with_retry(content):
+        """Uploads ``content`` through a transport that answers 503 once, then 200."""
+        statuses = iter([503, 200])
+        received = []
+
+        async def handler(request):
+            received.append(await request.aread())
+            return httpx.Response(next(statuses))
+
+        async def upload():
+            connector = AsyncSandboxConnector(
+                sandbox_id="my-sandbox",
+                namespace="dev",
+                connection_config=SandboxDirectConnectionConfig(api_url="http://router"),
+                k8s_helper=MagicMock(),
+                transport=httpx.MockTransport(handler),
+            )
+            fs = AsyncFilesystem(connector, MagicMock(), trace_service_name="test")
+            try:
+                await fs.write("data.bin", content)
+            finally:
+                await connector.close()
+
+        with patch("k8s_agent_sandbox.async_connector.asyncio.sleep", new_callable=AsyncMock):
+            asyncio.run(upload())
+        return received
+
+    def test_async_retried_upload_resends_whole_file(self):
+        received = self._async_upload_with_retry(io.BytesIO(b"x" * 5000))
+
+        self.assertEqual(len(received), 2)
+        for body in received:
+            self.assertIn(b"x" * 5000, body)
+
+    def test_async_partially_read_file_is_uploaded_from_start(self):
+        fileobj = io.BytesIO(b"header|payload")
+        fileobj.read(7)
+
+        received = self._async_upload_with_retry(fileobj)
+
+        for body in received:
+            self.assertIn(b"\r\n\r\nheader|payload\r\n", body)
+
+    def test_async_retried_upload_rejects_non_seekable_stream(self):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"x" * 5000)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+            with self.assertRaisesRegex(ValueError, "seekable"):
+                self._async_upload_with_retry(pipe)
+            # Nothing was consumed from the stream or sent.
+            self.assertEqual(len(pipe.read()), 5000)
+
+
+class TestFilesystemReadToFileObject(unittest.TestCase):
+    def test_read_streams_into_file_object(self):
+        connector = MagicMock()
+        response = connector.send_request.return_value
+        response.iter_content.return_value = iter([b"abc", b"def"])
+        fs = Filesystem(connector, MagicMock(), trace_service_name="test")
+        out = io.BytesIO()
+
+        result = fs.read("data.bin", out=out, chunk_size=3)
+
+        self.assertIsNone(result)
+        self.assertEqual(out.getvalue(), b"abcdef")
+        self.assertTrue(connector.send_request.call_args.kwargs["stream"])
+        response.iter_content.assert_called_once_with(3)
+        response.__exit__.assert_called_once()
+
+
+class TestFilesystemJsonResponses(unittest.TestCase):
+    def test_list_and_exists_decode_raw_content(self):
+        connector = MagicMock()
+        response = connector.send_request.return_value
+        fs = Filesystem(connector, MagicMock(), trace_service_name="test")
+
+        response.content = b'[{"name": "a.txt", "size": 3, "type": "file", "mod_time": 1.0}]'
+        entries = fs.list("/")
+        self.assertEqual([e.name for e in entries], ["a.txt"])
+
+        response.content = b'{"exists": true}'
+        self.assertTrue(fs.exists("a.txt"))
+
+    def test_list_rejects_malformed_json(self):
+        connector = MagicMock()
+        response = connector.send_request.return_value
+        response.content = b"<html>bad gateway</html>"
+        fs = Filesystem(connector, MagicMock(), trace_service_name="test")
+
+        with self.assertRaisesRegex(RuntimeError, "Failed to decode JSON"):
+            fs.list("/")
+
+
 class TestAsyncFilesystemSafePaths(TestFilesystemSafePaths):
     def setUp(self):
         self._connector = AsyncMock()
@@ -134,6 +134,25 @@ class TestK8sHelperCreateSandboxClaim(unittest.TestCase):
         self.assertNotIn("additionalPodMetadata", body["spec"])
 
 
+@patch("k8s_agent_sandbox.k8s_helper._shared_api_client", None)
+@patch("k8s_agent_sandbox.k8s_helper.client.ApiClient")
+@patch("k8s_agent_sandbox.k8s_helper.config")
+class TestK8sHelperSharedApiClient(unittest.TestCase):
+
+    def test_helpers_share_one_api_client(self, mock_config, mock_api_client_cls):
+        first = K8sHelper()
+        second = K8sHelper()
+
+        mock_api_client_cls.assert_called_once()
+        (configuration,), _ = mock_api_client_cls.call_args
+        self.assertGreaterEqual(configuration.connection_pool_maxsize, 32)
+        mock_config.load_incluster_config.assert_called_once()
+        shared = mock_api_client_cls.return_value
+        for helper in (first, second):
+            self.assertIs(helper.custom_objects_api.api_client, shared)
+            self.assertIs(helper.core_v1_api.api_client, shared)
+
+
 @patch("k8s_agent_sandbox.k8s_helper.client.CoreV1Api")
 @patch("k8s_agent_sandbox.k8s_helper.client.CustomObjectsApi")
 @patch("k8s_agent_sandbox.k8s_helper.config")
@@ -829,6 +848,30 @@ class TestK8sHelperWatchResourceVersion(unittest.TestCase):
             helper.wait_for_claim_ready("test-claim", "default", timeout=5)
         self.assertEqual(ctx.exception.status, 403)
 
+    @patch("k8s_agent_sandbox.k8s_helper.watch.Watch")
+    def test_sandbox_ready_watch_resumes_and_survives_410(self, mock_watch_class, mock_config, mock_api_cls, mock_core_cls):
+        """A stream that ends resumes from the last-seen resourceVersion; a
+        410 Gone restarts from the current state instead of failing."""
+        not_ready = {"type": "MODIFIED", "object": {
+            "metadata": {"resourceVersion": "7"},
+            "status": {"conditions": [{"type": "Ready", "status": "False"}]},
+        }}
+        ready = {"type": "MODIFIED", "object": {
+            "metadata": {"resourceVersion": "9"},
+            "status": {"conditions": [{"type": "Ready", "status": "True"}], "podIPs": ["10.0.0.1"]},
+        }}
+        mock_watch = MagicMock()
+        mock_watch.stream.side_effect = [[not_ready], client.ApiException(status=410), [ready]]
+        mock_watch_class.return_value = mock_watch
+
+        helper = K8sHelper()
+        pod_ip = helper.wait_for_sandbox_ready("sb", "default", timeout=5)
+
+        self.assertEqual(pod_ip, "10.0.0.1")
+        rvs = [c.kwargs["resource_version"] for c in mock_watch.stream.call_args_list]
+        self.assertEqual(rvs, [None, "7", None])
+        mock_watch_class.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import unittest
 from unittest.mock import MagicMock, patch
 import time
@@ -68,6 +69,11 @@ class TestMetrics(unittest.TestCase):
         
         process = MagicMock()
         process.poll.return_value = None 
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"Forwarding from 127.0.0.1:12345 -> 8080\n")
+        process.stdout = os.fdopen(read_fd, "rb")
+        self.addCleanup(process.stdout.close)
+        self.addCleanup(os.close, write_fd)
         mock_popen.return_value = process
         
         s = MagicMock()
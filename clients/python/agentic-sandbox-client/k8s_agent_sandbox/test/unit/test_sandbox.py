@@ -90,6 +90,7 @@ class TestSandbox(unittest.TestCase):
         mock_k8s_helper_instance = MagicMock()
         mock_connection_config = MagicMock()
         mock_tracer_config = SandboxTracerConfig(trace_service_name="custom-tracer")
+        mock_http_adapter = MagicMock()
         mock_tracer, mock_manager = MagicMock(), MagicMock()
         mock_create_tracer_manager.return_value = (mock_manager, mock_tracer)
 
@@ -99,7 +100,8 @@ class TestSandbox(unittest.TestCase):
             claim_name="custom-claim",
             connection_config=mock_connection_config,
             tracer_config=mock_tracer_config,
-            k8s_helper=mock_k8s_helper_instance
+            k8s_helper=mock_k8s_helper_instance,
+            http_adapter=mock_http_adapter,
         )
 
         mock_k8s_helper.assert_not_called()
@@ -111,6 +113,7 @@ class TestSandbox(unittest.TestCase):
             connection_config=mock_connection_config,
             k8s_helper=mock_k8s_helper_instance,
             get_pod_ip=sandbox.get_pod_ip,
+            http_adapter=mock_http_adapter,
         )
 
         mock_create_tracer_manager.assert_called_once_with(mock_tracer_config)
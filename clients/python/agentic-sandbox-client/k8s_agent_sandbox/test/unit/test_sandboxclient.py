@@ -13,6 +13,9 @@
 # limitations under the License.
 
 import json
+import os
+import subprocess
+import sys
 import threading
 import unittest
 from datetime import datetime, timezone
@@ -25,8 +28,9 @@ from urllib3.util.retry import Retry
 
 from kubernetes import config as k8s_config
 from k8s_agent_sandbox.sandbox_client import SandboxClient
-from k8s_agent_sandbox.connector import SandboxConnector
+from k8s_agent_sandbox.connector import SandboxConnector, _get_shared_adapter
 from k8s_agent_sandbox.pod_metadata import validate_labels
+from k8s_agent_sandbox.utils import generate_claim_name
 from k8s_agent_sandbox.models import (
     SandboxDirectConnectionConfig,
     SandboxInClusterConnectionConfig,
@@ -50,9 +54,9 @@ class TestSandboxClient(unittest.TestCase):
         self.mock_sandbox_class = MagicMock()
         self.client.sandbox_class = self.mock_sandbox_class
 
-    @patch('uuid.uuid4')
-    def test_create_sandbox_success(self, mock_uuid):
-        mock_uuid.return_value.hex = '1234abcd'
+    @patch('k8s_agent_sandbox.sandbox_client.generate_claim_name')
+    def test_create_sandbox_success(self, mock_claim_name):
+        mock_claim_name.return_value = 'sandbox-claim-1234abcd'
         self.mock_k8s_helper.wait_for_claim_ready.return_value = "resolved-id"
         self.mock_k8s_helper.get_sandbox.return_value = {
             "metadata": {"annotations": {POD_NAME_ANNOTATION: "custom-pod-name"}}
@@ -90,9 +94,9 @@ class TestSandboxClient(unittest.TestCase):
             self.assertEqual(len(self.client._active_connection_sandboxes), 1)
             self.assertEqual(self.client._active_connection_sandboxes[("test-namespace", "sandbox-claim-1234abcd")], mock_sandbox_instance)
 
-    @patch('uuid.uuid4')
-    def test_create_sandbox_failure_cleanup(self, mock_uuid):
-        mock_uuid.return_value.hex = '1234abcd'
+    @patch('k8s_agent_sandbox.sandbox_client.generate_claim_name')
+    def test_create_sandbox_failure_cleanup(self, mock_claim_name):
+        mock_claim_name.return_value = 'sandbox-claim-1234abcd'
         self.mock_k8s_helper.wait_for_claim_ready.side_effect = Exception("Timeout Error")
 
         with patch.object(self.client, '_create_claim') as mock_create_claim:
@@ -103,6 +107,31 @@ class TestSandboxClient(unittest.TestCase):
             # Ensure delete_sandbox_claim is called to cleanup orphan claim on failure
             self.mock_k8s_helper.delete_sandbox_claim.assert_called_once_with("sandbox-claim-1234abcd", "test-namespace")
 
+    def test_generate_claim_name_is_unique(self):
+        names = [generate_claim_name() for _ in range(1000)]
+        self.assertEqual(len(set(names)), len(names))
+        for name in names:
+            self.assertRegex(name, r"^sandbox-claim-[0-9a-f]{12,}$")
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_generate_claim_name_is_reseeded_after_fork(self):
+        parent_name = generate_claim_name()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(write_fd, generate_claim_name().encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            child_name = pipe.read()
+        os.waitpid(pid, 0)
+
+        # Names are "sandbox-claim-" + 8-hex-digit nonce + counter.
+        nonce = slice(len("sandbox-claim-"), len("sandbox-claim-") + 8)
+        self.assertNotEqual(child_name[nonce], parent_name[nonce])
+
     def test_get_sandbox_existing_active(self):
         mock_sandbox = MagicMock()
         mock_sandbox.is_active = True
@@ -204,9 +233,9 @@ class TestSandboxClient(unittest.TestCase):
             mock_delete.assert_any_call("claim1", namespace="ns1")
             mock_delete.assert_any_call("claim2", namespace="ns2")
 
-    @patch('uuid.uuid4')
-    def test_create_sandbox_with_labels(self, mock_uuid):
-        mock_uuid.return_value.hex = '1234abcd'
+    @patch('k8s_agent_sandbox.sandbox_client.generate_claim_name')
+    def test_create_sandbox_with_labels(self, mock_claim_name):
+        mock_claim_name.return_value = 'sandbox-claim-1234abcd'
         self.mock_k8s_helper.resolve_sandbox_name.return_value = "resolved-id"
 
         mock_sandbox_instance = MagicMock()
@@ -227,9 +256,9 @@ class TestSandboxClient(unittest.TestCase):
                 pod_metadata=None,
             )
 
-    @patch('uuid.uuid4')
-    def test_create_sandbox_with_pod_metadata(self, mock_uuid):
-        mock_uuid.return_value.hex = '1234abcd'
+    @patch('k8s_agent_sandbox.sandbox_client.generate_claim_name')
+    def test_create_sandbox_with_pod_metadata(self, mock_claim_name):
+        mock_claim_name.return_value = 'sandbox-claim-1234abcd'
         self.mock_k8s_helper.resolve_sandbox_name.return_value = "resolved-id"
 
         mock_sandbox_instance = MagicMock()
@@ -260,9 +289,9 @@ class TestSandboxClient(unittest.TestCase):
             self.client.create_sandbox("test-warmpool", pod_labels={"bad key!": "value"})
         self.assertIn("invalid characters", str(ctx.exception))
 
-    @patch('uuid.uuid4')
-    def test_create_sandbox_with_volume_claim_templates(self, mock_uuid):
-        mock_uuid.return_value.hex = '1234abcd'
+    @patch('k8s_agent_sandbox.sandbox_client.generate_claim_name')
+    def test_create_sandbox_with_volume_claim_templates(self, mock_claim_name):
+        mock_claim_name.return_value = 'sandbox-claim-1234abcd'
         self.mock_k8s_helper.resolve_sandbox_name.return_value = "resolved-id"
 
         mock_sandbox_instance = MagicMock()
@@ -406,9 +435,9 @@ class TestSandboxClient(unittest.TestCase):
             "sandbox-id", "test-namespace", 45
         )
 
-    @patch('uuid.uuid4')
-    def test_create_sandbox_with_shutdown_after_seconds(self, mock_uuid):
-        mock_uuid.return_value.hex = '1234abcd'
+    @patch('k8s_agent_sandbox.sandbox_client.generate_claim_name')
+    def test_create_sandbox_with_shutdown_after_seconds(self, mock_claim_name):
+        mock_claim_name.return_value = 'sandbox-claim-1234abcd'
         self.mock_k8s_helper.resolve_sandbox_name.return_value = "resolved-id"
 
         mock_sandbox_instance = MagicMock()
@@ -427,9 +456,9 @@ class TestSandboxClient(unittest.TestCase):
             self.assertEqual(lifecycle["shutdownPolicy"], "Delete")
             self.assertIn("shutdownTime", lifecycle)
 
-    @patch('uuid.uuid4')
-    def test_create_sandbox_without_shutdown_after_seconds(self, mock_uuid):
-        mock_uuid.return_value.hex = '1234abcd'
+    @patch('k8s_agent_sandbox.sandbox_client.generate_claim_name')
+    def test_create_sandbox_without_shutdown_after_seconds(self, mock_claim_name):
+        mock_claim_name.return_value = 'sandbox-claim-1234abcd'
         self.mock_k8s_helper.resolve_sandbox_name.return_value = "resolved-id"
 
         mock_sandbox_instance = MagicMock()
@@ -526,7 +555,11 @@ class TestSandboxClient(unittest.TestCase):
 class SandboxHandler(BaseHTTPRequestHandler):
     """Minimal api handler with basic routing to exercise error paths."""
 
+    # Paths of every POST received, so tests can count retried attempts.
+    post_paths: list = []
+
     def do_POST(self):
+        self.post_paths.append(self.path)
         if self.path == "/run":
             self._respond(HTTPStatus.ACCEPTED, {"status": "accepted", "message": "Trajectory execution started"})
         elif self.path == "/run-busy":
@@ -603,6 +636,19 @@ class TestRequestExceptions(unittest.TestCase):
         response = connector.send_request("GET", "health")
         self.assertEqual(response.status_code, 200)
 
+    @patch("urllib3.util.retry.time.sleep")
+    def test_503_keeps_status_after_retries_run_out(self, _):
+        """The default adapter retries 503, then surfaces the final response."""
+        connector = self._make_connector()
+        connector.session.mount("http://", _get_shared_adapter())
+        SandboxHandler.post_paths.clear()
+        with self.assertRaises(SandboxRequestError) as ctx:
+            connector.send_request("POST", "run-shutdown")
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual(ctx.exception.response.json()["detail"],
+                         "Service is shutting down, cannot accept new jobs")
+        self.assertEqual(SandboxHandler.post_paths, ["/run-shutdown"] * 4)
+
     def test_409_raises_sandbox_request_error(self):
         """Validates 409 SandboxRequestError."""
         connector = self._make_connector()
@@ -791,8 +837,8 @@ class TestSandboxClientInClusterConfig(unittest.TestCase):
 
     def _create_sandbox_with_in_cluster_config(self, namespace='default'):
         with patch('k8s_agent_sandbox.sandbox_client.K8sHelper'), \
-             patch('uuid.uuid4') as mock_uuid:
-            mock_uuid.return_value.hex = 'aabbccdd'
+             patch('k8s_agent_sandbox.sandbox_client.generate_claim_name') as mock_claim_name:
+            mock_claim_name.return_value = 'sandbox-claim-aabbccdd'
             client = SandboxClient(connection_config=SandboxInClusterConnectionConfig())
             client.k8s_helper.resolve_sandbox_name.return_value = 'my-sandbox'
             mock_sandbox_class = MagicMock()
@@ -817,6 +863,57 @@ class TestSandboxClientInClusterConfig(unittest.TestCase):
         self.assertNotIn('pod_ip', call_kwargs)
 
 
+class TestSandboxClientHttpAdapter(unittest.TestCase):
+    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
+    def test_http_adapter_reaches_every_sandbox_connector(self, _):
+        adapter = HTTPAdapter(pool_maxsize=4)
+        client = SandboxClient(
+            connection_config=SandboxDirectConnectionConfig(api_url="http://sandbox.example"),
+            http_adapter=adapter,
+        )
+        client.k8s_helper.resolve_sandbox_name.side_effect = lambda claim, ns, timeout: f"{claim}-id"
+        client.k8s_helper.get_sandbox.return_value = {"metadata": {}}
+
+        first = client.get_sandbox("claim-a")
+        second = client.get_sandbox("claim-b")
+
+        for sandbox in (first, second):
+            self.assertIs(sandbox.connector.session.get_adapter("http://sandbox.example"), adapter)
+            self.assertIs(sandbox.connector.session.get_adapter("https://sandbox.example"), adapter)
+
+        # The adapter is shared, so closing one sandbox must not close it.
+        with patch.object(adapter, "close") as close:
+            first.close_connection()
+        close.assert_not_called()
+
+    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
+    def test_default_retry_settings_use_shared_adapter(self, _):
+        client = SandboxClient(connection_config=SandboxDirectConnectionConfig(api_url="http://x"))
+        self.assertIsNone(client.http_adapter)
+
+    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
+    def test_http_retry_settings_build_adapter(self, _):
+        client = SandboxClient(
+            connection_config=SandboxDirectConnectionConfig(api_url="http://x"),
+            http_retries=1,
+            http_backoff_factor=0.1,
+            http_retry_statuses=(503,),
+        )
+        retry = client.http_adapter.max_retries
+        self.assertEqual(retry.total, 1)
+        self.assertEqual(retry.backoff_factor, 0.1)
+        self.assertEqual(retry.status_forcelist, frozenset((503,)))
+
+    @patch('k8s_agent_sandbox.sandbox_client.K8sHelper')
+    def test_http_retry_settings_conflict_with_http_adapter(self, _):
+        with self.assertRaises(ValueError):
+            SandboxClient(
+                connection_config=SandboxDirectConnectionConfig(api_url="http://x"),
+                http_adapter=HTTPAdapter(),
+                http_retries=0,
+            )
+
+
 from pydantic import ValidationError
 
 class TestConnectionConfigValidation(unittest.TestCase):
@@ -842,5 +939,36 @@ class TestConnectionConfigValidation(unittest.TestCase):
                 SandboxLocalTunnelConnectionConfig(router_namespace=ns)
 
 
+class TestPackageLazyImports(unittest.TestCase):
+    def test_importing_models_does_not_load_kubernetes_or_requests(self):
+        code = (
+            "import sys, k8s_agent_sandbox.models; "
+            "print('kubernetes' in sys.modules, 'requests' in sys.modules)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False False")
+
+    def test_clients_resolve_on_attribute_access(self):
+        import k8s_agent_sandbox
+        self.assertIs(k8s_agent_sandbox.SandboxClient, SandboxClient)
+        with self.assertRaises(AttributeError):
+            k8s_agent_sandbox.NoSuchClient
+
+    def test_lazy_clients_are_listed(self):
+        code = (
+            "import k8s_agent_sandbox as pkg; "
+            "print('SandboxClient' in dir(pkg), 'AsyncSandboxClient' in dir(pkg), "
+            "'SandboxClient' in vars(pkg))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        # Listed by dir() without being imported eagerly.
+        self.assertEqual(out.stdout.strip(), "True True False")
+
+        import k8s_agent_sandbox
+        for name in k8s_agent_sandbox.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(hasattr(k8s_agent_sandbox, name))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,55 @@
+# Copyright 2026 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from k8s_agent_sandbox import trace_manager
+from k8s_agent_sandbox.models import SandboxTracerConfig
+
+
+class TestCreateTracerManager(unittest.TestCase):
+
+    def setUp(self):
+        self.always_off = object()
+        self.mock_trace = MagicMock()
+        for patcher in (
+            patch.object(trace_manager, "OPENTELEMETRY_AVAILABLE", True),
+            patch.object(trace_manager, "ALWAYS_OFF", self.always_off, create=True),
+            patch.object(trace_manager, "trace", self.mock_trace),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.config = SandboxTracerConfig(enable_tracing=True)
+
+    def test_always_off_sampler_disables_tracing(self):
+        self.mock_trace.get_tracer_provider.return_value = SimpleNamespace(
+            sampler=self.always_off
+        )
+
+        self.assertEqual(trace_manager.create_tracer_manager(self.config), (None, None))
+        self.mock_trace.get_tracer.assert_not_called()
+
+    def test_other_sampler_returns_manager(self):
+        self.mock_trace.get_tracer_provider.return_value = SimpleNamespace(sampler=object())
+
+        manager, tracer = trace_manager.create_tracer_manager(self.config)
+
+        self.assertIsInstance(manager, trace_manager.TracerManager)
+        self.assertIs(tracer, manager.tracer)
+
+
+if __name__ == "__main__":
+    unittest.main()
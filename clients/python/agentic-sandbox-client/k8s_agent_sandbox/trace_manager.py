@@ -37,6 +37,7 @@ try:
     from opentelemetry.sdk.resources import Resource
     from opentelemetry.sdk.trace import TracerProvider
     from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
     from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
     OPENTELEMETRY_AVAILABLE = True
 except ImportError:
@@ -56,6 +57,10 @@ except ImportError:
         def end(self):
             """Mock end."""
 
+    # MockSpan is stateless, so a single instance serves every
+    # get_current_span()/start_span() call on the hot paths.
+    _NOOP_SPAN = MockSpan()
+
     class MockTracer:
         """Mock class for OpenTelemetry Tracer."""
 
@@ -65,14 +70,14 @@ except ImportError:
 
         def start_span(self, *args, **kwargs):
             """Mock start_span."""
-            return MockSpan()
+            return _NOOP_SPAN
 
     class TraceStub:
         """Mock class for OpenTelemetry trace module."""
         @staticmethod
         def get_current_span():
             """Mock get_current_span."""
-            return MockSpan()
+            return _NOOP_SPAN
 
         @staticmethod
         def set_tracer_provider(_):
@@ -267,5 +272,14 @@ def create_tracer_manager(config: "SandboxTracerConfig"):
         logging.error("OpenTelemetry not installed; skipping tracer initialization.")
         return None, None
 
+    # With an always_off sampler (e.g. OTEL_TRACES_SAMPLER=always_off) every
+    # span would be dropped anyway; skip the per-call span machinery entirely.
+    # This also drops the lifecycle span and the trace context otherwise
+    # propagated into claim annotations. ParentBased(ALWAYS_OFF) is left
+    # alone: it still samples spans whose caller-side parent was sampled.
+    if getattr(trace.get_tracer_provider(), "sampler", None) is ALWAYS_OFF:
+        logging.debug("Tracer sampler is always_off; tracing disabled.")
+        return None, None
+
     manager = TracerManager(service_name=config.trace_service_name)
     return manager, manager.tracer
@@ -17,6 +17,50 @@
 from collections.abc import Mapping, Sequence
 from datetime import datetime, timedelta, timezone
 import ipaddress
+import itertools
+import os
+import secrets
+from typing import Any
+
+from .constants import CLAIM_API_GROUP_VERSION, CLIENT_REQUEST_TIME_ANNOTATION, CREATED_BY_LABEL
+
+# Execute responses can carry megabytes of stdout; use a SIMD parser from
+# the optional ``speedups`` extra when installed, else the stdlib parser.
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import simdjson as _json
+    except ImportError:
+        import json as _json
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON response body. Raises ``ValueError`` on malformed input."""
+    return _json.loads(content)
+
+
+# Claim names only need to be unique within a namespace: a per-process random
+# prefix plus a counter avoids drawing from the OS entropy pool per claim.
+# Forked children would otherwise inherit both, so they draw a fresh prefix.
+_claim_name_nonce = ""
+_claim_name_counter = itertools.count()
+
+
+def _reseed_claim_names() -> None:
+    global _claim_name_nonce, _claim_name_counter
+    _claim_name_nonce = secrets.token_hex(4)
+    _claim_name_counter = itertools.count()
+
+
+_reseed_claim_names()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_claim_names)
+
+
+def generate_claim_name() -> str:
+    """Returns a SandboxClaim name unique to this process."""
+    return f"sandbox-claim-{_claim_name_nonce}{next(_claim_name_counter):04x}"
 
 
 def construct_sandbox_claim_lifecycle_spec(shutdown_after_seconds: int) -> dict[str, str]:
@@ -49,6 +93,47 @@ def construct_sandbox_claim_lifecycle_spec(shutdown_after_seconds: int) -> dict[
     }
 
 
+def build_sandbox_claim_manifest(
+    name: str,
+    warmpool: str,
+    annotations: dict | None = None,
+    labels: dict | None = None,
+    lifecycle: dict | None = None,
+    volume_claim_templates: list[dict] | None = None,
+    pod_metadata: dict | None = None,
+) -> dict:
+    """Build the SandboxClaim manifest submitted by both the sync and async helpers.
+
+    Stamps the client request time annotation unless the caller supplied one,
+    and always labels the claim as created by the Python client.
+    """
+    updated_annotations = dict(annotations) if annotations else {}
+    if CLIENT_REQUEST_TIME_ANNOTATION not in updated_annotations:
+        updated_annotations[CLIENT_REQUEST_TIME_ANNOTATION] = datetime.now(timezone.utc).isoformat()
+
+    spec: dict[str, Any] = {"warmPoolRef": {"name": warmpool}}
+    if lifecycle:
+        spec["lifecycle"] = lifecycle
+    if volume_claim_templates:
+        spec["volumeClaimTemplates"] = volume_claim_templates
+    if pod_metadata:
+        spec["additionalPodMetadata"] = pod_metadata
+
+    return {
+        "apiVersion": CLAIM_API_GROUP_VERSION,
+        "kind": "SandboxClaim",
+        "metadata": {
+            "name": name,
+            "annotations": updated_annotations,
+            "labels": {
+                **(labels or {}),
+                CREATED_BY_LABEL: "python-client",
+            },
+        },
+        "spec": spec,
+    }
+
+
 def select_pod_ip(ips: Sequence[object] | None) -> str | None:
     """Selects a prioritized and normalized Pod IP address from a list of IPs.
 
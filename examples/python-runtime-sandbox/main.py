@@ -32,6 +32,11 @@ class ExecuteResponse(BaseModel):
     stderr: str
     exit_code: int
 
+class ExecuteBatchRequest(BaseModel):
+    """Request model for the /execute_batch endpoint."""
+    commands: list[str]
+    stop_on_error: bool = True
+
 def get_safe_path(file_path: str) -> str:
     """Sanitizes the file path to ensure it stays within /app."""
     base_dir = os.path.realpath("/app")
@@ -55,15 +60,14 @@ async def health_check():
     """A simple health check endpoint to confirm the server is running."""
     return {"status": "ok", "message": "Sandbox Runtime is active."}
 
-@app.post("/execute", summary="Execute a shell command", response_model=ExecuteResponse)
-async def execute_command(request: ExecuteRequest):
+def run_command(command: str) -> ExecuteResponse:
     """
     Executes a shell command inside the sandbox and returns its output.
     Uses shlex.split for security to prevent shell injection.
     """
     try:
         # Split the command string into a list to safely pass to subprocess
-        args = shlex.split(request.command)
+        args = shlex.split(command)
         
         # Execute the command, always from the /app directory
         process = subprocess.run(
@@ -84,6 +88,28 @@ async def execute_command(request: ExecuteRequest):
             exit_code=1
         )
 
+@app.post("/execute", summary="Execute a shell command", response_model=ExecuteResponse)
+async def execute_command(request: ExecuteRequest):
+    """
+    Executes a shell command inside the sandbox and returns its output.
+    """
+    return run_command(request.command)
+
+@app.post("/execute_batch", summary="Execute shell commands in order", response_model=list[ExecuteResponse])
+async def execute_batch(request: ExecuteBatchRequest):
+    """
+    Executes several shell commands sequentially and returns one result per
+    command run. With stop_on_error, execution stops after the first command
+    that exits non-zero.
+    """
+    results = []
+    for command in request.commands:
+        result = run_command(command)
+        results.append(result)
+        if request.stop_on_error and result.exit_code != 0:
+            break
+    return results
+
 @app.post("/upload", summary="Upload a file to the sandbox")
 async def upload_file(file: UploadFile = File(...)):
     """